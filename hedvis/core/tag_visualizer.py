@@ -1,15 +1,95 @@
 """Main API for generating HED tag visualizations."""
 
-from typing import Dict, Optional, Union, List, Any
+from __future__ import annotations
+
+import functools
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, BinaryIO, Dict, Optional, Union, List, Any
 from pathlib import Path
+import numpy as np
 from PIL import Image
-from hed import HedSchema
-from hed.models import TabularInput
-from hed.tools.analysis.hed_tag_counts import HedTagCounts
-from hed.tools.analysis.event_manager import EventManager
-from hed.tools.analysis.hed_tag_manager import HedTagManager
-from hedvis.generators import word_cloud
-from hedvis.core.visualization_config import VisualizationConfig
+from hedvis.generators import word_cloud, word_cloud_util
+from hedvis.core.visualization_config import VisualizationConfig, WordCloudConfig
+
+if TYPE_CHECKING:
+    from hed import HedSchema
+    from hed.models import TabularInput
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
+# Fetches the (tag, events) pair of a HedTagCount in a single C-level call
+_tag_and_events = attrgetter("tag", "events")
+
+
+def _tag_frequencies(tag_count_objs) -> Dict[str, int]:
+    """Return a dictionary mapping interned tag strings to event counts.
+
+    Parameters:
+        tag_count_objs: Iterable of HedTagCount objects.
+
+    Returns:
+        Dictionary mapping tag strings to frequencies.
+
+    Notes:
+        Tags come from a finite schema vocabulary, so interning lets repeated tags share one string
+        object and speeds up the hashing and comparisons done by the word cloud. HedTagCounts has
+        already summed the events of each tag, so this is a mapping rather than a counting loop.
+    """
+    return {sys.intern(tag): events for tag, events in map(_tag_and_events, tag_count_objs)}
+
+
+def _top_frequencies(word_freq: Dict[str, int], max_words: int) -> Dict[str, int]:
+    """Return the most frequent words in descending order of frequency.
+
+    Parameters:
+        word_freq: Dictionary mapping words to frequencies.
+        max_words: Maximum number of words to keep.
+
+    Returns:
+        Dictionary with at most max_words entries, ordered as ``sorted(..., reverse=True)`` would order them.
+
+    Notes:
+        WordCloud sorts its input again, but sorting already-ordered data is linear.
+    """
+    words = list(word_freq)
+    counts = np.fromiter(word_freq.values(), dtype=np.float64, count=len(words))
+    order = np.argsort(-counts, kind="stable")[:max_words]
+    return {words[i]: word_freq[words[i]] for i in order.tolist()}
+
+
+# Output formats that word clouds can be written in
+_SUPPORTED_FORMATS = ("svg", "png", "jpg", "jpeg")
+
+
+def _write_bytes(target: Union[str, Path, BinaryIO], data) -> None:
+    """Write bytes to a file path or to a binary file object.
+
+    Parameters:
+        target: Path of the file to write, or an object with a ``write`` method.
+        data (bytes-like): The bytes to write.
+    """
+    if hasattr(target, "write"):
+        target.write(data)
+    else:
+        Path(target).write_bytes(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schema_cached(schema_spec: str) -> HedSchema:
+    """Load a HED schema once per specification string.
+
+    Parameters:
+        schema_spec: Schema specification passed to ``hed.load_schema``.
+
+    Returns:
+        HedSchema: The loaded schema, shared between calls (schemas are not modified after loading).
+    """
+    from hed import load_schema
+
+    return load_schema(schema_spec)
 
 
 class HedTagVisualizer:
@@ -28,7 +108,7 @@ class HedTagVisualizer:
                    If None, uses default configuration.
         """
         if config is None:
-            config = VisualizationConfig()
+            config = VisualizationConfig.default()
         elif isinstance(config, dict):
             config = VisualizationConfig.from_dict(config)
 
@@ -127,11 +207,11 @@ class HedTagVisualizer:
         Returns:
             Dictionary with generated visualizations.
         """
-        from hed import load_schema
+        from hed.models import TabularInput
 
         # Load schema if string provided
         if isinstance(schema, str):
-            schema = load_schema(schema)
+            schema = _load_schema_cached(schema)
 
         # Create TabularInput
         tabular = TabularInput(df, sidecar=sidecar, name=name)
@@ -167,14 +247,19 @@ class HedTagVisualizer:
         Returns:
             HedTagCounts: Computed tag frequency data.
         """
+        from hed.tools.analysis.hed_tag_counts import HedTagCounts
+        from hed.tools.analysis.event_manager import EventManager
+        from hed.tools.analysis.hed_tag_manager import HedTagManager
+
         if remove_types is None:
             remove_types = []
 
-        tag_counts = HedTagCounts(tabular_input.name, total_events=len(tabular_input.dataframe))
+        name = tabular_input.name
+        tag_counts = HedTagCounts(name, total_events=len(tabular_input.dataframe))
         tag_man = HedTagManager(EventManager(tabular_input, schema), remove_types=remove_types)
-        hed_objs = tag_man.get_hed_objs(include_context=include_context, replace_defs=replace_defs)
-        for hed in hed_objs:
-            tag_counts.update_tag_counts(hed, tabular_input.name)
+        update = tag_counts.update_tag_counts
+        for hed in tag_man.get_hed_objs(include_context=include_context, replace_defs=replace_defs):
+            update(hed, name)
 
         return tag_counts
 
@@ -190,24 +275,18 @@ class HedTagVisualizer:
         Returns:
             Dictionary mapping tag strings to frequencies.
         """
-        word_freq = {}
-
         if tag_template:
             # Use template to organize tags
             organized, unmatched = tag_counts.organize_tags(tag_template)
 
             # Extract frequencies from organized tags
-            for _category, tags in organized.items():
-                for tag in tags:
-                    word_freq[tag.tag] = tag.events
+            word_freq = _tag_frequencies(chain.from_iterable(organized.values()))
 
             # Also include unmatched tags if they exist
-            for tag in unmatched:
-                word_freq[tag.tag] = tag.events
+            word_freq.update(_tag_frequencies(unmatched))
         else:
             # Use all tags from tag_dict - values are HedTagCount objects
-            for _tag_key, tag_count in tag_counts.tag_dict.items():
-                word_freq[tag_count.tag] = tag_count.events
+            word_freq = _tag_frequencies(tag_counts.tag_dict.values())
 
         return word_freq
 
@@ -222,6 +301,7 @@ class HedTagVisualizer:
             Dictionary with word cloud data (file paths and/or objects).
         """
         wc_config = self.config.word_cloud
+        max_words, max_font_size, font_path = wc_config.max_words, wc_config.max_font_size, wc_config.font_path
 
         # Prepare keyword arguments for word cloud generator
         kwargs = {
@@ -233,21 +313,22 @@ class HedTagVisualizer:
             "contour_width": wc_config.contour_width,
             "contour_color": wc_config.contour_color,
             "relative_scaling": wc_config.relative_scaling,
+            "max_words": max_words,
         }
 
-        if wc_config.max_font_size:
-            kwargs["max_font_size"] = wc_config.max_font_size
-
-        if wc_config.font_path:
-            kwargs["font_path"] = wc_config.font_path
+        if max_font_size:
+            kwargs["max_font_size"] = max_font_size
 
-        # Set up color function
-        from hedvis.generators.word_cloud_util import ColormapColorFunc
+        if font_path:
+            kwargs["font_path"] = font_path
 
-        color_func = ColormapColorFunc(
+        # Set up color function. Each render gets its own, since it steps through the colormap as words are drawn
+        kwargs["color_func"] = word_cloud_util.ColormapColorFunc(
             colormap=wc_config.colormap, color_range=wc_config.color_range, color_step_range=wc_config.color_step_range
-        )
-        kwargs["color_func"] = color_func.color_func
+        ).color_func
+
+        # Only the most frequent words can be drawn, so drop the rest and pre-sort before layout
+        word_freq = _top_frequencies(word_freq, max_words)
 
         # Generate word cloud
         mask_path = wc_config.mask_path if wc_config.use_mask else None
@@ -255,27 +336,119 @@ class HedTagVisualizer:
 
         result = {"wordcloud_object": wc}
 
-        # Save to files if directory specified
-        if self.config.save_directory:
-            save_dir = Path(self.config.save_directory)
-            save_dir.mkdir(parents=True, exist_ok=True)
-
-            for fmt in self.config.output_formats:
-                if fmt == "svg":
-                    svg_path = save_dir / f"{output_basename}.svg"
-                    svg_content = word_cloud.word_cloud_to_svg(wc)
-                    svg_path.write_text(svg_content, encoding="utf-8")
-                    result["svg_path"] = str(svg_path)
-                elif fmt in ["png", "jpg", "jpeg"]:
-                    img_path = save_dir / f"{output_basename}.{fmt}"
-                    img = wc.to_image()
-                    # Convert RGBA to RGB for JPEG
-                    if fmt in ["jpg", "jpeg"] and img.mode == "RGBA":
-                        rgb_img = Image.new("RGB", img.size, (255, 255, 255))
-                        rgb_img.paste(img, mask=img.split()[3])
-                        rgb_img.save(str(img_path))
-                    else:
-                        img.save(str(img_path))
-                    result[f"{fmt}_path"] = str(img_path)
+        # Save to files if directory and at least one output format specified
+        if self.config.save_directory and self.config.output_formats:
+            result.update(self._save_word_cloud(wc, output_basename))
 
         return result
+
+    def _save_word_cloud(self, wc, output_basename: str) -> Dict[str, str]:
+        """Save a word cloud in each of the configured output formats.
+
+        Parameters:
+            wc (WordCloud): The generated word cloud.
+            output_basename: Base name for output files.
+
+        Returns:
+            Dictionary mapping '<format>_path' keys to the saved file paths.
+        """
+        save_dir = Path(self.config.save_directory)
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        targets = {
+            fmt: save_dir / f"{output_basename}.{fmt}"
+            for fmt in self.config.output_formats
+            if fmt in _SUPPORTED_FORMATS
+        }
+        self.write_word_cloud(wc, targets)
+        return {f"{fmt}_path": str(path) for fmt, path in targets.items()}
+
+    def write_word_cloud(self, wc, outputs: Dict[str, Union[str, Path, BinaryIO]]):
+        """Write a word cloud in several formats to files or binary file objects.
+
+        Parameters:
+            wc (WordCloud): The generated word cloud.
+            outputs: Dictionary mapping formats ('svg', 'png', 'jpg' or 'jpeg') to file paths or to
+                     binary file objects such as io.BytesIO. Unsupported formats are skipped.
+
+        Notes:
+            The raster image is rendered once and shared by all PNG/JPEG outputs, and each encoding
+            is done once even when it is written under several extensions (jpg and jpeg). When several
+            formats are requested they are written concurrently, since SVG serialization and
+            PIL encoding are independent. File objects are written to but not closed. If the
+            configuration has no word cloud settings, the WordCloudConfig defaults are used.
+        """
+        wc_config = self.config.word_cloud or WordCloudConfig()
+        formats = [fmt for fmt in outputs if fmt in _SUPPORTED_FORMATS]
+        img = wc.to_image() if any(fmt != "svg" for fmt in formats) else None
+        rgb_img = img
+        # Convert RGBA to RGB for JPEG
+        if img is not None and img.mode == "RGBA" and any(fmt in ["jpg", "jpeg"] for fmt in formats):
+            if wc.background_color is not None:
+                # The word cloud was drawn on an opaque background, so there is nothing to composite
+                rgb_img = img.convert("RGB")
+            else:
+                rgb_img = Image.new("RGB", img.size, (255, 255, 255))
+                rgb_img.paste(img, mask=img.getchannel("A"))
+
+        raster_targets = {"PNG": [], "JPEG": []}
+        tasks = []
+        for fmt in formats:
+            if fmt == "svg":
+                tasks.append(functools.partial(self._write_svg, wc, outputs[fmt], wc_config.svg_optimize))
+            else:
+                raster_targets["PNG" if fmt == "png" else "JPEG"].append(outputs[fmt])
+
+        # Each encoding is done once, however many outputs share it
+        if raster_targets["PNG"]:
+            tasks.append(functools.partial(self._write_raster, img, raster_targets["PNG"], "PNG"))
+        if raster_targets["JPEG"]:
+            tasks.append(
+                functools.partial(
+                    self._write_raster,
+                    rgb_img,
+                    raster_targets["JPEG"],
+                    "JPEG",
+                    quality=85,
+                    optimize=True,
+                    progressive=True,
+                )
+            )
+
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                for future in [executor.submit(task) for task in tasks]:
+                    future.result()
+        else:
+            for task in tasks:
+                task()
+
+    @staticmethod
+    def _write_svg(wc, target: Union[str, Path, BinaryIO], optimize: bool = False):
+        """Write a word cloud as SVG.
+
+        Parameters:
+            wc (WordCloud): The generated word cloud.
+            target: Path of the SVG file to write, or a binary file object.
+            optimize: If True, minify the SVG before writing it.
+        """
+        svg_content = word_cloud.word_cloud_to_svg(wc)
+        if optimize:
+            svg_content = word_cloud_util.minify_svg(svg_content)
+        _write_bytes(target, svg_content.encode("utf-8"))
+
+    @staticmethod
+    def _write_raster(img, targets: List[Union[str, Path, BinaryIO]], image_format: str, **params):
+        """Encode an image in memory once and write it to each target with a single write.
+
+        Parameters:
+            img (PIL.Image.Image): Image to save.
+            targets: Paths of the files to write, or binary file objects.
+            image_format: PIL format name (e.g., 'PNG' or 'JPEG').
+            **params: Encoder options passed to Image.save.
+        """
+        buffer = io.BytesIO()
+        img.save(buffer, format=image_format, **params)
+        data = buffer.getbuffer()
+        for target in targets:
+            _write_bytes(target, data)
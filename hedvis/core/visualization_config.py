@@ -1,13 +1,105 @@
 """Configuration classes for HED visualizations."""
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+import functools
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Optional, Dict, Any, Sequence
 
 
-@dataclass
+def _freeze(value):
+    """Return a hashable, type-preserving key for a configuration value.
+
+    Parameters:
+        value: Configuration value (dicts, lists and tuples are frozen recursively).
+
+    Returns:
+        tuple: A (kind, payload) pair that can be reversed with ``_thaw``.
+
+    :raises TypeError:
+        The value or one of its nested values is not hashable.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return "dict", tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if value_type in (list, tuple):
+        return value_type.__name__, tuple(_freeze(item) for item in value)
+    hash(value)
+    return value_type, value
+
+
+def _thaw(frozen):
+    """Rebuild a configuration value from the key produced by ``_freeze``.
+
+    Parameters:
+        frozen (tuple): A (kind, payload) pair returned by ``_freeze``.
+
+    Returns:
+        Any: A fresh copy of the original value.
+    """
+    kind, payload = frozen
+    if kind == "dict":
+        return {key: _thaw(item) for key, item in payload}
+    if kind == "list":
+        return [_thaw(item) for item in payload]
+    if kind == "tuple":
+        return tuple(_thaw(item) for item in payload)
+    return payload
+
+
+@functools.lru_cache(maxsize=128)
+def _build_from_frozen(cls, items):
+    """Build (and memoize) a configuration object from frozen dictionary items.
+
+    Parameters:
+        cls (type): Configuration class providing a ``_build`` classmethod.
+        items (tuple): Frozen dictionary items as produced by ``_freeze``.
+
+    Returns:
+        The configuration object built from the thawed dictionary.
+    """
+    return cls._build(_thaw(("dict", items)))
+
+
+@functools.cache
+def _default_instance(cls):
+    """Build (once per class) the configuration object with all default values.
+
+    Parameters:
+        cls (type): Configuration class.
+
+    Returns:
+        The shared default configuration object.
+
+    Notes:
+        Kept apart from the bounded from_dict cache so that it is never evicted.
+    """
+    return cls()
+
+
+def _from_dict_cached(cls, config_dict):
+    """Return a memoized configuration object for the dictionary if it can be frozen.
+
+    Parameters:
+        cls (type): Configuration class providing a ``_build`` classmethod.
+        config_dict (dict): Dictionary with configuration parameters.
+
+    Returns:
+        The configuration object, shared between calls with equal dictionaries when possible.
+    """
+    try:
+        _kind, items = _freeze(config_dict)
+    except TypeError:
+        # Unhashable values (or unsortable keys) cannot be cached
+        return cls._build(config_dict)
+    return _build_from_frozen(cls, items)
+
+
+@dataclass(slots=True, frozen=True)
 class WordCloudConfig:
     """Configuration for word cloud visualizations.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a modified copy.
+
     Attributes:
         width: Width of word cloud in pixels.
         height: Height of word cloud in pixels.
@@ -15,6 +107,7 @@ class WordCloudConfig:
         prefer_horizontal: Fraction of words oriented horizontally (0.0-1.0).
         min_font_size: Minimum font size in points.
         max_font_size: Maximum font size in points (auto-calculated if None).
+        max_words: Maximum number of words (the most frequent) included in the cloud.
         font_path: Path to TTF/OTF font file (None uses default).
         colormap: Matplotlib colormap name for word colors.
         color_range: Tuple of (min, max) values from colormap to use.
@@ -25,6 +118,7 @@ class WordCloudConfig:
         contour_color: Color name for contour line.
         scale_adjustment: Adjustment factor for log-transformed frequencies.
         relative_scaling: Scaling factor for word sizes (0.0-1.0).
+        svg_optimize: Whether to minify SVG output (hex colors, rounded numbers, no extra whitespace).
     """
 
     # Dimensions
@@ -36,6 +130,7 @@ class WordCloudConfig:
     prefer_horizontal: float = 0.75
     min_font_size: int = 8
     max_font_size: Optional[int] = None  # Auto-calculated if None
+    max_words: int = 200
 
     # Font settings
     font_path: Optional[str] = None
@@ -55,6 +150,14 @@ class WordCloudConfig:
     scale_adjustment: float = 0.0  # For log-transform adjustments
     relative_scaling: float = 1.0
 
+    # Output
+    svg_optimize: bool = False
+
+    def __post_init__(self):
+        # Ranges given as lists (e.g., from JSON) are stored as tuples to keep the config hashable
+        object.__setattr__(self, "color_range", tuple(self.color_range))
+        object.__setattr__(self, "color_step_range", tuple(self.color_step_range))
+
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "WordCloudConfig":
         """Create configuration from dictionary.
@@ -64,9 +167,18 @@ class WordCloudConfig:
 
         Returns:
             WordCloudConfig: Configuration object.
+
+        Notes:
+            Results are memoized, so equal dictionaries return the same instance, which should be
+            treated as read-only.
         """
+        return _from_dict_cached(cls, config_dict)
+
+    @classmethod
+    def _build(cls, config_dict: Dict[str, Any]) -> "WordCloudConfig":
+        """Create configuration from dictionary without memoization."""
         # Filter to only valid fields
-        valid_fields = {k: v for k, v in config_dict.items() if k in cls.__dataclass_fields__}
+        valid_fields = {k: v for k, v in config_dict.items() if k in cls._FIELDS}
         return cls(**valid_fields)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -75,21 +187,31 @@ class WordCloudConfig:
         Returns:
             dict: Dictionary representation of configuration.
         """
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return dict(zip(self._PUBLIC_FIELDS, self._GETTER(self), strict=True))
+
+
+# Valid field names, computed once for filtering in from_dict and serializing in to_dict
+WordCloudConfig._FIELDS = frozenset(WordCloudConfig.__dataclass_fields__)
+WordCloudConfig._PUBLIC_FIELDS = tuple(
+    name for name in WordCloudConfig.__dataclass_fields__ if not name.startswith("_")
+)
+WordCloudConfig._GETTER = attrgetter(*WordCloudConfig._PUBLIC_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VisualizationConfig:
     """Master configuration for all HED visualizations.
 
+    Instances are immutable and hashable; use ``dataclasses.replace`` to derive a modified copy.
+
     Attributes:
-        output_formats: List of output formats ('svg', 'png', 'jpg', etc.).
+        output_formats: Output formats ('svg', 'png', 'jpg', etc.); any sequence is stored as a tuple.
         save_directory: Directory path for saving visualizations (None = don't save).
         word_cloud: Configuration for word cloud visualization (None = don't generate).
     """
 
     # Output settings
-    output_formats: List[str] = field(default_factory=lambda: ["svg"])
+    output_formats: Sequence[str] = ("svg",)
     save_directory: Optional[str] = None
 
     # Visualization types to generate
@@ -100,6 +222,23 @@ class VisualizationConfig:
     # network: Optional[NetworkConfig] = None
     # heatmap: Optional[HeatmapConfig] = None
 
+    # Fields holding nested config objects (extend when adding visualization types)
+    _NESTED = frozenset({"word_cloud"})
+
+    def __post_init__(self):
+        # Store sequences as tuples so that shared (memoized) instances cannot be changed in place
+        object.__setattr__(self, "output_formats", tuple(self.output_formats))
+
+    @classmethod
+    def default(cls) -> "VisualizationConfig":
+        """Return the shared configuration with all default values.
+
+        Returns:
+            VisualizationConfig: The same instance on every call, equal to ``VisualizationConfig()``,
+            which should be treated as read-only.
+        """
+        return _default_instance(cls)
+
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "VisualizationConfig":
         """Create configuration from dictionary.
@@ -112,15 +251,21 @@ class VisualizationConfig:
 
         Notes:
             Nested dictionaries are automatically converted to appropriate config objects.
+            Results are memoized, so equal dictionaries return the same instance, which should be
+            treated as read-only.
         """
-        config = config_dict.copy()
+        return _from_dict_cached(cls, config_dict)
 
-        # Handle nested word_cloud config
-        if "word_cloud" in config and isinstance(config["word_cloud"], dict):
-            config["word_cloud"] = WordCloudConfig.from_dict(config["word_cloud"])
+    @classmethod
+    def _build(cls, config_dict: Dict[str, Any]) -> "VisualizationConfig":
+        """Create configuration from dictionary without memoization."""
+        # Filter to only valid fields; the filtered dictionary is new, so the input is never modified
+        valid_fields = {k: v for k, v in config_dict.items() if k in cls._FIELDS}
 
-        # Filter to only valid fields
-        valid_fields = {k: v for k, v in config.items() if k in cls.__dataclass_fields__}
+        # Handle nested word_cloud config (config objects pass through unchanged)
+        word_cloud = valid_fields.get("word_cloud")
+        if isinstance(word_cloud, dict):
+            valid_fields["word_cloud"] = WordCloudConfig.from_dict(word_cloud)
         return cls(**valid_fields)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -129,12 +274,15 @@ class VisualizationConfig:
         Returns:
             dict: Dictionary representation of configuration.
         """
-        result = {}
-        for key, value in self.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if hasattr(value, "to_dict"):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
+        result = dict(zip(self._FIELD_NAMES, self._GETTER(self), strict=True))
+        result["output_formats"] = list(self.output_formats)
+        for name in self._NESTED:
+            if result[name] is not None:
+                result[name] = result[name].to_dict()
         return result
+
+
+# Valid field names, computed once for filtering in from_dict and serializing in to_dict
+VisualizationConfig._FIELDS = frozenset(VisualizationConfig.__dataclass_fields__)
+VisualizationConfig._FIELD_NAMES = tuple(VisualizationConfig.__dataclass_fields__)
+VisualizationConfig._GETTER = attrgetter(*VisualizationConfig._FIELD_NAMES)
@@ -1,13 +1,47 @@
 """Utilities for creating a word cloud."""
 
+import functools
+import threading
+from contextlib import contextmanager
+
 import numpy as np
-from PIL import Image
-from hed.errors.exceptions import HedFileError
+from PIL import Image, ImageFont
 from hedvis.generators import word_cloud_util
 from wordcloud import WordCloud
 
 MIN_WORD_CLOUD_SIZE = 100
 
+# WordCloud loads a fresh FreeType face for every candidate font size of every word.
+_cached_truetype = functools.lru_cache(maxsize=256)(ImageFont.truetype)
+
+
+# Guards the patching of ImageFont.truetype, which is shared by every thread
+_font_cache_lock = threading.Lock()
+_font_cache_users = 0
+_original_truetype = None
+
+
+@contextmanager
+def _font_cache():
+    """Route ``ImageFont.truetype`` through an LRU cache of loaded fonts while word clouds are built.
+
+    The patch is reference counted under a lock: the first user installs it and the last user
+    restores the original, so concurrent word clouds on several threads cannot leave it installed.
+    """
+    global _font_cache_users, _original_truetype
+    with _font_cache_lock:
+        if _font_cache_users == 0:
+            _original_truetype = ImageFont.truetype
+            ImageFont.truetype = _cached_truetype
+        _font_cache_users += 1
+    try:
+        yield
+    finally:
+        with _font_cache_lock:
+            _font_cache_users -= 1
+            if _font_cache_users == 0:
+                ImageFont.truetype = _original_truetype
+
 
 def create_wordcloud(word_dict, mask_path=None, background_color=None, width=400, height=300, **kwargs):
     """Takes a word dict and returns a generated word cloud object.
@@ -50,13 +84,17 @@ def create_wordcloud(word_dict, mask_path=None, background_color=None, width=400
     if "font_path" not in kwargs:
         kwargs["font_path"] = None
     elif kwargs["font_path"] and not kwargs["font_path"].lower().endswith((".ttf", ".otf", ".ttc")):
+        # Imported here because importing hed is slow and only this error path needs it
+        from hed.errors.exceptions import HedFileError
+
         raise HedFileError("InvalidFontPath", f"Font {kwargs['font_path']} not valid on this system", "")
 
     wc = WordCloud(
         background_color=background_color, mask=mask_image, width=width, height=height, mode="RGBA", **kwargs
     )
 
-    wc.generate_from_frequencies(word_dict)
+    with _font_cache():
+        wc.generate_from_frequencies(word_dict)
 
     return wc
 
@@ -71,10 +109,15 @@ def word_cloud_to_svg(wc):
        str: The svg for the word cloud.
 
     """
-    svg_string = wc.to_svg()
+    with _font_cache():
+        svg_string = wc.to_svg()
     svg_string = svg_string.replace("fill:", "fill:rgb")
-    svg_string = svg_string.replace("</svg>", word_cloud_util.generate_contour_svg(wc, wc.width, wc.height) + "</svg>")
-    return svg_string
+    contour_svg = word_cloud_util.generate_contour_svg(wc, wc.width, wc.height)
+    # Splice the contour in before the closing tag with a single join rather than a full-string replace
+    head, closing_tag, tail = svg_string.rpartition("</svg>")
+    if not contour_svg or not closing_tag:
+        return svg_string
+    return "".join((head, contour_svg, closing_tag, tail))
 
 
 def load_and_resize_mask(mask_path, width=None, height=None):
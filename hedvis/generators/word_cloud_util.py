@@ -1,6 +1,8 @@
 """Support utilities for word cloud generation."""
 
+import functools
 import random
+import re
 from random import Random
 
 import numpy as np
@@ -111,6 +113,57 @@ def _numpy_to_svg(contour, radius=1, color="black"):
     return "\n".join(svg_elements)
 
 
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+_EMPTY_TAG_END_RE = re.compile(r"\s+/>")
+_ATTRIBUTE_RE = re.compile(r'="([^"]*)"')
+_RGB_RE = re.compile(r"rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)")
+_DECIMAL_RE = re.compile(r"-?\d+\.\d+")
+# A run of adjacent contour circles (see _numpy_to_svg) that share their stroke and fill color
+_CIRCLE_RUN_RE = re.compile(
+    r'<circle cx="[^"]*" cy="[^"]*" r="[^"]*" stroke="([^"]*)" fill="\1"/>'
+    r'(?:<circle cx="[^"]*" cy="[^"]*" r="[^"]*" stroke="\1" fill="\1"/>)*'
+)
+
+
+def minify_svg(svg_string, digits=2):
+    """Return a smaller, equivalent SVG string.
+
+    Parameters:
+        svg_string (str): The SVG to minify, as produced by word_cloud_to_svg.
+        digits (int): Number of decimal places kept for numbers in attribute values.
+
+    Returns:
+        str: The minified SVG.
+
+    Notes:
+        Whitespace between tags and before "/>" is removed, rgb() colors become hex colors and
+        decimal numbers are rounded. Only attribute values are rewritten, so the words themselves
+        are never changed. Runs of contour circles are wrapped in a group that carries their
+        shared stroke and fill.
+    """
+
+    def to_hex(match):
+        return "#{:02x}{:02x}{:02x}".format(*(min(int(channel), 255) for channel in match.groups()))
+
+    def round_number(match):
+        text = f"{float(match.group()):.{digits}f}".rstrip("0").rstrip(".")
+        return "0" if text == "-0" else text
+
+    def shorten_attribute(match):
+        value = _DECIMAL_RE.sub(round_number, _RGB_RE.sub(to_hex, match.group(1)))
+        return f'="{value}"'
+
+    def group_circles(match):
+        color = match.group(1)
+        circles = match.group().replace(f' stroke="{color}" fill="{color}"', "")
+        return f'<g stroke="{color}" fill="{color}">{circles}</g>'
+
+    svg_string = _BETWEEN_TAGS_RE.sub("><", svg_string.strip())
+    svg_string = _EMPTY_TAG_END_RE.sub("/>", svg_string)
+    svg_string = _ATTRIBUTE_RE.sub(shorten_attribute, svg_string)
+    return _CIRCLE_RUN_RE.sub(group_circles, svg_string)
+
+
 def random_color_darker(random_state=None):
     """Random color generation function.
 
@@ -126,6 +179,19 @@ def random_color_darker(random_state=None):
     return f"hsl({random_state.randint(0, 255)}, {random_state.randint(50, 100)}%, {random_state.randint(0, 50)}%)"
 
 
+@functools.lru_cache(maxsize=32)
+def _get_colormap(name):
+    """Return a (cached) matplotlib colormap.
+
+    Parameters:
+        name (str): Matplotlib colormap name.
+
+    Returns:
+        matplotlib.colors.Colormap: The colormap, shared between calls (it is only read).
+    """
+    return mp1.colormaps[name]
+
+
 class ColormapColorFunc:
     """Represents a colormap."""
 
@@ -142,7 +208,7 @@ class ColormapColorFunc:
                                                          This is the speed at which it goes through the range chosen.
                                                          .25 means it will go through 1/4 of the range each pick.
         """
-        self.colormap = mp1.colormaps[colormap]
+        self.colormap = _get_colormap(colormap)
         self.color_range = color_range
         self.color_step_range = color_step_range
         self.current_fraction = random.uniform(0, 1)  # Start at a random point
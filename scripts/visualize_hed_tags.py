@@ -12,6 +12,7 @@ Logging Options:
 - --log-level DEBUG: Show detailed debugging information
 - --log-file FILE: Save logs to a file instead of/in addition to stderr
 - --log-quiet: When using --log-file, suppress stderr output (file only)
+- --log-append: When using --log-file, append to the file instead of overwriting it
 
 Examples:
     # Process event files with default HED schema
@@ -29,6 +30,12 @@ Examples:
     # Process with JSON sidecar pattern and exclude directories
     visualize_hed_tags /path/to/data --sidecar-pattern '*_events.json' --exclude-dirs derivatives
 
+    # Count tags in parallel using all CPUs
+    visualize_hed_tags /path/to/data --jobs 0 --output-dir ./output
+
+    # Reuse the counts of unchanged files from a previous run
+    visualize_hed_tags /path/to/data --cache-dir ./hed_cache --output-dir ./output
+
     # Filter to specific files and use custom mask
     visualize_hed_tags /path/to/data --filter 'sub-01' --mask brain_mask.png
 
@@ -39,23 +46,44 @@ Examples:
     visualize_hed_tags /path/to/data --tag-template template.json --output-dir ./output
 """
 
+from __future__ import annotations
+
 import argparse
+import fnmatch
+import hashlib
+import importlib.metadata as importlib_metadata
+import os
+import pickle
+import re
 import sys
 import logging
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
+# hed and hedvis (which pulls in wordcloud and matplotlib) are imported inside the functions that
+# need them, so --help and argument errors do not pay for loading them.
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, falls back to the standard json module
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# (settings, handlers) installed by the last setup_logging call
+_LAST_LOG_CFG = None
 
-from hed import _version as vr
-from hed.schema import load_schema_version
-from hed.models import TabularInput
-from hed.tools.util.io_util import get_file_list
-from hed.tools.analysis.hed_tag_counts import HedTagCounts
-from hed.tools.analysis.event_manager import EventManager
-from hed.tools.analysis.hed_tag_manager import HedTagManager
+# Bump when _count_hed_objs or the pickled counts change, so --cache-dir entries are recomputed
+_CACHE_FORMAT = 1
 
-from hedvis.core.tag_visualizer import HedTagVisualizer
-from hedvis.core.visualization_config import VisualizationConfig, WordCloudConfig
+# First "_"-separated entity of a BIDS file stem that starts with "task-"
+_TASK_RE = re.compile(r"(?:^|_)(task-[^_]*)")
 
 
 def get_parser():
@@ -211,6 +239,27 @@ def get_parser():
         default=None,
         help="Maximum font size in points. If not specified, auto-calculated.",
     )
+    parser.add_argument(
+        "--svg-optimize",
+        action="store_true",
+        help="Minify SVG output (hex colors, rounded coordinates, no extra whitespace).",
+    )
+
+    # Performance arguments
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to count tags (0 uses all CPUs). Default: 1",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        help="Directory in which to cache per-file tag counts so unchanged files are skipped on later runs. "
+        "Only the latest entry for each file is kept.",
+    )
 
     # Logging arguments
     parser.add_argument(
@@ -234,6 +283,13 @@ def get_parser():
         dest="log_quiet",
         help="If present, suppress log output to stderr (only applies if --log-file is used).",
     )
+    parser.add_argument(
+        "-la",
+        "--log-append",
+        action="store_true",
+        dest="log_append",
+        help="If present, append to --log-file instead of overwriting it.",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -252,18 +308,34 @@ def setup_logging(args):
 
     Returns:
         logging.Logger: Configured logger instance.
+
+    Notes:
+        Repeated calls with the same settings (e.g., main called several times in one process) keep
+        the handlers installed by the previous call, so the log file is not reopened and truncated.
     """
+    global _LAST_LOG_CFG
+
     # Determine log level
     log_level = args.log_level.upper() if args.log_level else "WARNING"
     if args.verbose:
         log_level = "INFO"
 
+    append = getattr(args, "log_append", False)
+    root_logger = logging.getLogger()
+    log_cfg = (log_level, args.log_file, args.log_quiet, append, sys.stderr)
+    if _LAST_LOG_CFG is not None:
+        last_cfg, last_handlers = _LAST_LOG_CFG
+        if last_cfg == log_cfg and tuple(root_logger.handlers) == last_handlers:
+            return logging.getLogger("visualize_hed_tags")
+        # Release the file opened by the previous configuration
+        for handler in last_handlers:
+            handler.close()
+
     # Configure logging format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
     # Clear any existing handlers from root logger
-    root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
@@ -275,7 +347,7 @@ def setup_logging(args):
 
     # File handler if log file specified
     if args.log_file:
-        file_handler = logging.FileHandler(args.log_file, mode="w")
+        file_handler = logging.FileHandler(args.log_file, mode="a" if append else "w")
         file_handler.setLevel(getattr(logging, log_level))
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
@@ -287,14 +359,174 @@ def setup_logging(args):
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
 
+    _LAST_LOG_CFG = (log_cfg, tuple(root_logger.handlers))
+
     logger = logging.getLogger("visualize_hed_tags")
-    logger.info(f"Starting HED tag visualization with log level: {log_level}")
+    logger.info("Starting HED tag visualization with log level: %s", log_level)
     if args.log_file:
-        logger.info(f"Logging to file: {args.log_file}")
+        logger.info("Logging to file: %s", args.log_file)
 
     return logger
 
 
+def iter_file_list(root_path, name_prefix=None, name_suffix=None, extensions=None, exclude_dirs=None, path_filter=None):
+    """Yield the full paths of files satisfying various conditions.
+
+    This is a generator counterpart of hedtools' get_file_list with the same matching rules.
+
+    Parameters:
+        root_path (str): Full path of the directory tree to be traversed (no ending slash).
+        name_prefix (list, str, None): An optional prefix for the base filename.
+        name_suffix (list, str, None): An optional suffix for the base filename.
+        extensions (list, None): A list of extensions to be selected.
+        exclude_dirs (list, None): A list of directory names to be excluded.
+        path_filter (str, None): An optional substring that the full path must contain.
+
+    Yields:
+        str: The full path of each matching file, in os.walk order.
+    """
+    matches = _make_predicate(name_prefix, name_suffix, extensions)
+    exclude_dirs = set(exclude_dirs or [])
+    for root, dirs, files in os.walk(root_path, topdown=True):
+        # Prune excluded directories so their subtrees are never visited
+        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+        for r_file in files:
+            if matches(r_file):
+                path = os.path.realpath(os.path.join(root, r_file))
+                if not path_filter or path_filter in path:
+                    yield path
+
+
+def _make_predicate(name_prefix=None, name_suffix=None, extensions=None):
+    """Build a filename test with the matching rules of hedtools' check_filename.
+
+    Parameters:
+        name_prefix (list, str, None): An optional prefix for the base filename.
+        name_suffix (list, str, None): An optional suffix for the base filename.
+        extensions (list, str, None): An optional extension or list of extensions.
+
+    Returns:
+        callable: Takes a base filename and returns True if it matches.
+
+    Notes:
+        The allowed values are lowercased once here rather than on every call. As in
+        check_filename, matching is case-insensitive and the first allowed value that matches is
+        the one used. The extension is tested first because it rejects most non-event files.
+    """
+
+    def lowered(values):
+        if not values:
+            return ()
+        if not isinstance(values, list):
+            values = [values]
+        return tuple(value.lower() for value in values)
+
+    prefixes, suffixes, exts = lowered(name_prefix), lowered(name_suffix), lowered(extensions)
+    splitext = os.path.splitext
+
+    def predicate(filename):
+        name = filename.lower()
+        if exts:
+            ext = next(filter(name.endswith, exts), None)
+            if not ext:
+                return False
+            stem = name[: -len(ext)]
+        else:
+            stem = splitext(name)[0]
+        if prefixes and not next(filter(name.startswith, prefixes), None):
+            return False
+        return not suffixes or bool(next(filter(stem.endswith, suffixes), None))
+
+    return predicate
+
+
+def _task_sidecar_name(filename: str) -> Optional[str]:
+    """Return the BIDS task-level sidecar name for a file stem.
+
+    Parameters:
+        filename: Stem of a BIDS file such as sub-001_task-Name_run-01_events.
+
+    Returns:
+        Name of the task-level sidecar (e.g., task-Name_events.json) or None if there is no task entity.
+    """
+    match = _TASK_RE.search(filename)
+    return f"{match.group(1)}_events.json" if match else None
+
+
+@lru_cache(maxsize=1024)
+def _index_directory(directory: Path, sidecar_pattern: Optional[str] = None) -> Tuple[frozenset, Optional[str]]:
+    """Scan a directory once for sidecar lookups.
+
+    Parameters:
+        directory: Directory to scan.
+        sidecar_pattern: Optional glob pattern for sidecar files.
+
+    Returns:
+        tuple: (names of the files in the directory, first name matching sidecar_pattern or None).
+
+    Notes:
+        Results are cached per (directory, sidecar_pattern); count_tags clears the cache at the
+        start of each run so a new run sees the current directory contents.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset(), None
+    pattern_match = None
+    if sidecar_pattern:
+        # Same matching as fnmatch.filter, keeping the alphabetically first match without sorting
+        match = _compile_sidecar_pattern(sidecar_pattern)
+        normcase = os.path.normcase
+        pattern_match = min((name for name in names if match(normcase(name))), default=None)
+    return names, pattern_match
+
+
+@lru_cache(maxsize=16)
+def _compile_sidecar_pattern(sidecar_pattern: str):
+    """Translate a sidecar glob pattern into a compiled regex match function once.
+
+    Parameters:
+        sidecar_pattern: Glob pattern for sidecar files (e.g., '*_events.json').
+
+    Returns:
+        callable: The match method of the compiled pattern, to be applied to normcase'd names.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(sidecar_pattern))).match
+
+
+def _is_path_pattern(sidecar_pattern: Optional[str]) -> bool:
+    """Return True if a sidecar pattern reaches outside the TSV's own directory.
+
+    Parameters:
+        sidecar_pattern: Optional glob pattern for sidecar files.
+
+    Returns:
+        bool: True if the pattern has a path separator or a recursive '**' component.
+    """
+    if not sidecar_pattern:
+        return False
+    separators = {"/", os.sep, os.altsep} - {None}
+    return "**" in sidecar_pattern or any(sep in sidecar_pattern for sep in separators)
+
+
+@lru_cache(maxsize=1024)
+def _glob_sidecar(directory: Path, sidecar_pattern: str) -> Optional[Path]:
+    """Find the first file (alphabetically) matching a sidecar pattern relative to a directory.
+
+    Parameters:
+        directory: Directory the pattern is relative to.
+        sidecar_pattern: Glob pattern with path parts (e.g., '../../*_events.json').
+
+    Returns:
+        Path to the matching file, or None if no file matches.
+
+    Notes:
+        Results are cached per (directory, sidecar_pattern) and cleared with _index_directory.
+    """
+    return min((path for path in directory.glob(sidecar_pattern) if path.is_file()), default=None)
+
+
 def find_sidecar(tsv_path: Path, sidecar_pattern: Optional[str] = None) -> Optional[Path]:
     """Find JSON sidecar file for a TSV file.
 
@@ -304,37 +536,22 @@ def find_sidecar(tsv_path: Path, sidecar_pattern: Optional[str] = None) -> Optio
 
     Returns:
         Path to sidecar file if found, None otherwise.
-    """
-    # Try same directory with same base name
-    json_path = tsv_path.with_suffix(".json")
-    if json_path.exists():
-        return json_path
-
-    # Try BIDS task-level sidecar (e.g., task-taskname_events.json)
-    # Extract task name from filename like sub-001_task-Name_run-01_events.tsv
-    filename = tsv_path.stem
-    if "task-" in filename:
-        # Extract the task part
-        parts = filename.split("_")
-        task_part = None
-        for part in parts:
-            if part.startswith("task-"):
-                task_part = part
-                break
-
-        if task_part:
-            # Try task-level sidecar: task-Name_events.json
-            task_sidecar = tsv_path.parent / f"{task_part}_events.json"
-            if task_sidecar.exists():
-                return task_sidecar
-
-    # Try with pattern if specified
-    if sidecar_pattern:
-        parent = tsv_path.parent
-        matches = list(parent.glob(sidecar_pattern))
-        if matches:
-            return matches[0]
 
+    Notes:
+        Candidates are tried in order: the same base name with a .json extension, the BIDS
+        task-level sidecar (e.g., task-Name_events.json for sub-001_task-Name_run-01_events.tsv),
+        and the first file (alphabetically) matching sidecar_pattern. The directory is scanned
+        once and the scan is shared by all files in it. Patterns with path parts (such as
+        '../../*_events.json' or '**/*.json') are resolved with Path.glob relative to the directory.
+    """
+    parent = tsv_path.parent
+    path_pattern = _is_path_pattern(sidecar_pattern)
+    names, pattern_match = _index_directory(parent, None if path_pattern else sidecar_pattern)
+    for name in (tsv_path.with_suffix(".json").name, _task_sidecar_name(tsv_path.stem), pattern_match):
+        if name and name in names:
+            return parent / name
+    if path_pattern:
+        return _glob_sidecar(parent, sidecar_pattern)
     return None
 
 
@@ -348,33 +565,342 @@ def load_tag_template(template_path: str) -> Optional[Dict[str, List[str]]]:
         Dictionary with tag template or None if loading fails.
     """
     try:
-        with open(template_path, "r") as f:
-            template = json.load(f)
-        return template
+        return _read_tag_template(str(template_path))
     except Exception as e:
-        logging.getLogger("visualize_hed_tags").error(f"Failed to load tag template: {e}")
+        logging.getLogger("visualize_hed_tags").error("Failed to load tag template: %s", e)
         return None
 
 
-def merge_tag_counts(all_counts: List[HedTagCounts]) -> HedTagCounts:
+@lru_cache(maxsize=16)
+def _read_tag_template(template_path: str) -> Dict[str, List[str]]:
+    """Parse a tag template JSON file once per path.
+
+    Parameters:
+        template_path: Path to JSON file with tag template.
+
+    Returns:
+        Dictionary with tag template. The cached dictionary is shared, so callers should not modify it.
+
+    Notes:
+        Failures raise and are therefore not cached.
+    """
+    with open(template_path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def merge_tag_counts(all_counts: Iterable[HedTagCounts]) -> HedTagCounts:
     """Merge multiple HedTagCounts into a single combined count.
 
     Parameters:
-        all_counts: List of HedTagCounts objects to merge.
+        all_counts: HedTagCounts objects to merge.
 
     Returns:
         HedTagCounts: Combined tag counts.
     """
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
     merged = HedTagCounts("Combined Dataset")
     for counts in all_counts:
-        # Use built-in merge method
-        merged.merge_tag_dicts(counts.tag_dict)
-        merged.total_events += counts.total_events
-        merged.files.update(counts.files)
-
+        _merge_into(merged, counts)
     return merged
 
 
+def _merge_into(merged: HedTagCounts, counts: HedTagCounts):
+    """Add one HedTagCounts into a running merged count in place.
+
+    Parameters:
+        merged: Combined tag counts being accumulated.
+        counts: Tag counts to add.
+
+    Notes:
+        Inlined equivalent of HedTagCounts.merge_tag_dicts: one lookup per tag and a bulk update of
+        the file keys. As upstream, merged entries start from get_empty() and carry no value counts.
+        A collections.Counter would not help: entries also carry file sets, and Counter.update
+        from a mapping is itself a Python-level loop.
+    """
+    tag_dict = merged.tag_dict
+    get_entry = tag_dict.get
+    for tag, count in counts.tag_dict.items():
+        entry = get_entry(tag)
+        if entry is None:
+            entry = tag_dict[tag] = count.get_empty()
+        entry.events += count.events
+        entry.files.update(count.files)
+    merged.total_events += counts.total_events
+    merged.files.update(counts.files)
+
+
+@lru_cache(maxsize=1)
+def _hed_version() -> str:
+    """Return the installed hedtools version.
+
+    Returns:
+        str: The version string, or 'unknown' if it cannot be determined.
+    """
+    try:
+        return importlib_metadata.version("hedtools")
+    except importlib_metadata.PackageNotFoundError:
+        import hed
+
+        return getattr(hed, "__version__", "unknown")
+
+
+@lru_cache(maxsize=4)
+def _load_schema_cached(schema_version):
+    """Load a HED schema version once per process.
+
+    Parameters:
+        schema_version (str): HED schema version (e.g., '8.3.0').
+
+    Returns:
+        HedSchema: The loaded schema, shared by all files processed in this process.
+    """
+    from hed.schema import load_schema_version
+
+    return load_schema_version(schema_version)
+
+
+def _init_worker(schema_version):
+    """Pre-load the HED schema in a worker process so the first file does not pay for it.
+
+    Parameters:
+        schema_version (str): HED schema version (e.g., '8.3.0').
+    """
+    _load_schema_cached(schema_version)
+
+
+def _count_hed_objs(tag_counts: HedTagCounts, hed_objs: Iterable, file_name: str):
+    """Count the tags of each HED object in place, once per object.
+
+    Parameters:
+        tag_counts: Tag counts to update.
+        hed_objs: HedString objects (or None for events without annotations).
+        file_name: Name of the file the objects came from.
+
+    Notes:
+        Produces the same counts as calling tag_counts.update_tag_counts(hed, file_name) for each
+        object, without building and merging a temporary HedTagCount dictionary per event. As there,
+        merged entries carry no value counts.
+    """
+    from hed.tools.analysis.hed_tag_counts import HedTagCount
+
+    tag_dict = tag_counts.tag_dict
+    get_entry = tag_dict.get
+    files = tag_counts.files
+    for hed in hed_objs:
+        files[file_name] = ""
+        if not hed:
+            continue
+        # Each tag is counted once per event
+        seen = set()
+        for tag in hed.get_all_tags():
+            key = tag.short_base_tag.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = get_entry(key)
+            if entry is None:
+                entry = tag_dict[key] = HedTagCount(tag, file_name)
+                entry.value_dict = {}
+            else:
+                entry.events += 1
+                entry.files[file_name] = ""
+
+
+def _counts_cache_file(cache_dir, tsv_path, sidecar, schema_version, remove_types, include_context, replace_defs):
+    """Return the cache file holding the counts of a TSV file for a given set of inputs and options.
+
+    Parameters:
+        cache_dir (str): Directory of cached per-file counts.
+        tsv_path (str): Path of the TSV file.
+        sidecar (str or None): Path of the sidecar used for the file.
+        schema_version (str): HED schema version.
+        remove_types (list or None): Type tags excluded from counts.
+        include_context (bool): Whether contextual tags are counted.
+        replace_defs (bool): Whether Def tags are replaced with their definitions.
+
+    Returns:
+        Path: Cache file path. The name changes whenever the TSV or sidecar is modified, an option
+        changes, or hedtools or the cache format is upgraded, so stale entries are never read.
+        The name starts with a hash of the TSV path, which _write_cached_counts uses to remove them.
+    """
+    stamps = [tsv_path, os.stat(tsv_path).st_mtime_ns]
+    if sidecar:
+        stamps += [sidecar, os.stat(sidecar).st_mtime_ns]
+    stamps += [schema_version, sorted(remove_types or []), include_context, replace_defs]
+    # Counts made by other hedtools versions or an older counting routine are not reused
+    stamps += [_hed_version(), _CACHE_FORMAT]
+    key = hashlib.sha1(repr(stamps).encode("utf-8")).hexdigest()
+    return Path(cache_dir) / f"{_path_hash(tsv_path)}-{key}.pkl"
+
+
+def _path_hash(tsv_path):
+    """Return the hash of a TSV path that starts the names of its cache files.
+
+    Parameters:
+        tsv_path (str): Path of the TSV file.
+
+    Returns:
+        str: Hex digest of the path.
+    """
+    return hashlib.sha1(str(tsv_path).encode("utf-8")).hexdigest()
+
+
+def _read_cached_counts(cache_file: Path) -> Optional[HedTagCounts]:
+    """Load cached counts, treating a missing or unreadable cache file as a miss.
+
+    Parameters:
+        cache_file: Path returned by _counts_cache_file.
+
+    Returns:
+        HedTagCounts or None: The cached counts, or None if they are not available.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated, corrupt or written by an incompatible hedtools version
+        return None
+
+
+def _write_cached_counts(cache_file: Path, tag_counts: HedTagCounts):
+    """Store counts in the cache, replacing the file atomically so concurrent workers never see partial data.
+
+    Parameters:
+        cache_file: Path returned by _counts_cache_file.
+        tag_counts: Counts of the file.
+
+    Notes:
+        Older entries for the same TSV path (written before the file, its sidecar or the options
+        changed) are removed, so the cache holds at most one entry per TSV file.
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            pickle.dump(tag_counts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        path_hash = cache_file.name.split("-", 1)[0]
+        for stale_file in cache_file.parent.glob(f"{path_hash}-*.pkl"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except OSError as e:
+        logging.getLogger("visualize_hed_tags").debug("  Could not cache counts in %s: %s", cache_file, e)
+        tmp_file.unlink(missing_ok=True)
+
+
+def _process_one_file(
+    tsv_path,
+    schema_version,
+    sidecar_pattern=None,
+    remove_types=None,
+    include_context=True,
+    replace_defs=True,
+    cache_dir=None,
+):
+    """Count the HED tags in a single tabular file.
+
+    Parameters:
+        tsv_path (str): Path of the TSV file to process.
+        schema_version (str): HED schema version, resolved through the per-process schema cache.
+        sidecar_pattern (str or None): Optional glob pattern for sidecar files.
+        remove_types (list or None): Type tags to exclude from counts.
+        include_context (bool): Include contextual tags in counts.
+        replace_defs (bool): Replace Def tags with their definitions.
+        cache_dir (str or None): Optional directory of cached per-file counts (see _counts_cache_file).
+
+    Returns:
+        tuple: (HedTagCounts, None) on success or (None, error message) on failure.
+
+    Notes:
+        This runs in worker processes, so errors are returned rather than raised to keep the
+        remaining files processing.
+    """
+    from hed.models import TabularInput
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+    from hed.tools.analysis.event_manager import EventManager
+    from hed.tools.analysis.hed_tag_manager import HedTagManager
+
+    logger = logging.getLogger("visualize_hed_tags")
+    try:
+        # One string object shared by the input name, the counts name and every file key
+        tsv_str = str(tsv_path)
+        logger.debug("Processing: %s", tsv_str)
+
+        # Find sidecar
+        sidecar_path = find_sidecar(Path(tsv_str), sidecar_pattern)
+        if sidecar_path:
+            logger.debug("  Found sidecar: %s", sidecar_path)
+            # Pass the path, not the loaded dictionary
+            sidecar = str(sidecar_path)
+        elif sidecar_pattern:
+            # The user asked for a sidecar; counting without one usually finds no tags
+            logger.warning("No sidecar matching %s found for %s", sidecar_pattern, tsv_str)
+            sidecar = None
+        else:
+            logger.debug("  No sidecar found")
+            sidecar = None
+
+        cache_file = None
+        if cache_dir:
+            cache_file = _counts_cache_file(
+                cache_dir, tsv_str, sidecar, schema_version, remove_types, include_context, replace_defs
+            )
+            tag_counts = _read_cached_counts(cache_file)
+            if tag_counts is not None:
+                logger.debug("  Using cached counts: %s", cache_file)
+                return tag_counts, None
+
+        # Create TabularInput
+        tabular = TabularInput(tsv_str, sidecar=sidecar, name=tsv_str)
+
+        n_events = len(tabular.dataframe)
+
+        # Compute tag counts
+        tag_counts = HedTagCounts(tsv_str, total_events=n_events)
+        schema = _load_schema_cached(schema_version)
+        tag_man = HedTagManager(EventManager(tabular, schema), remove_types=remove_types or [])
+        hed_objs = tag_man.get_hed_objs(include_context=include_context, replace_defs=replace_defs)
+        _count_hed_objs(tag_counts, hed_objs, tsv_str)
+
+        logger.debug("  Successfully processed: %s events, %s unique tags", n_events, len(tag_counts.tag_dict))
+        if cache_file is not None:
+            _write_cached_counts(cache_file, tag_counts)
+        return tag_counts, None
+
+    except Exception as e:
+        return None, str(e)
+
+
+def _process_chunk(tsv_paths, process_one):
+    """Count the tags in a group of files and reduce them to a single count.
+
+    Parameters:
+        tsv_paths (sequence): Paths of the TSV files in this chunk, in order.
+        process_one (callable): _process_one_file with its options bound.
+
+    Returns:
+        tuple: (HedTagCounts or None, number of files counted, list of (path, error message)).
+
+    Notes:
+        Worker processes reduce their own chunks, so the parent only merges one count per chunk and
+        receives one pickled result instead of one per file. The first file's counts become the
+        accumulator, so a single-file chunk adds no copying. Merging chunks in order gives the
+        same result as merging the files in order.
+    """
+    merged = None
+    errors = []
+    for tsv_path in tsv_paths:
+        tag_counts, error = process_one(tsv_path)
+        if error is not None:
+            errors.append((tsv_path, error))
+        elif merged is None:
+            merged = tag_counts
+        else:
+            _merge_into(merged, tag_counts)
+    return merged, len(tsv_paths) - len(errors), errors
+
+
 def process_files(args, logger):
     """Process files and generate visualizations.
 
@@ -385,22 +911,44 @@ def process_files(args, logger):
     Returns:
         tuple: (merged_tag_counts, visualization_results) or (None, None) on failure.
     """
-    logger.info(f"Data directory: {args.data_path}")
-    logger.info(f"HED tools version: {str(vr.get_versions())}")
+    merged_counts = count_tags(args, logger)
+    if merged_counts is None:
+        return None, None
+    return merged_counts, generate_visualizations(merged_counts, args, logger)
+
+
+def count_tags(args, logger) -> Optional[HedTagCounts]:
+    """Count the HED tags in all selected files and merge the counts.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command line arguments.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        HedTagCounts or None: Merged tag counts, or None on failure.
+    """
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
+    logger.info("Data directory: %s", args.data_path)
+    # Files may have changed since a previous run in this process
+    _index_directory.cache_clear()
+    _glob_sidecar.cache_clear()
+    _read_tag_template.cache_clear()
+    logger.info("HED tools version: %s", _hed_version())
 
     # Load HED schema
     logger.info("Loading HED schema...")
+    # Load latest stable version (8.3.0 is current stable as of documentation) if none given
+    schema_version = args.schema_version or "8.3.0"
     try:
+        _load_schema_cached(schema_version)
         if args.schema_version:
-            schema = load_schema_version(args.schema_version)
-            logger.info(f"Loaded HED schema version: {args.schema_version}")
+            logger.info("Loaded HED schema version: %s", schema_version)
         else:
-            # Load latest stable version (8.3.0 is current stable as of documentation)
-            schema = load_schema_version("8.3.0")
-            logger.info("Loaded HED schema version 8.3.0 (default)")
+            logger.info("Loaded HED schema version %s (default)", schema_version)
     except Exception as e:
-        logger.error(f"Failed to load HED schema: {e}")
-        return None, None
+        logger.error("Failed to load HED schema: %s", e)
+        return None
 
     # Handle wildcard suffix
     suffix_filter = None if args.name_suffix == "*" else args.name_suffix
@@ -410,107 +958,126 @@ def process_files(args, logger):
     if args.name_suffix == "*":
         logger.info("Using wildcard (*) - will match all TSV files")
 
+    candidates = iter_file_list(
+        root_path=args.data_path,
+        name_prefix=args.name_prefix,
+        name_suffix=suffix_filter,
+        extensions=[".tsv"],
+        exclude_dirs=args.exclude_dirs,
+        path_filter=args.filename_filter,
+    )
+    if args.filename_filter:
+        logger.info("Applying filename filter '%s'", args.filename_filter)
+
     try:
-        file_list = get_file_list(
-            root_path=args.data_path,
-            name_prefix=args.name_prefix,
-            name_suffix=suffix_filter,
-            extensions=[".tsv"],
-            exclude_dirs=args.exclude_dirs,
-        )
+        file_list = list(candidates)
     except Exception as e:
-        logger.error(f"Error searching for files: {e}")
-        return None, None
-
-    # Apply filename filter
-    if args.filename_filter:
-        original_count = len(file_list)
-        file_list = [f for f in file_list if args.filename_filter in str(f)]
-        logger.info(f"Applied filename filter '{args.filename_filter}': {original_count} -> {len(file_list)} files")
+        logger.error("Error searching for files: %s", e)
+        return None
 
     if not file_list:
         logger.error("No TSV files found matching the specified criteria.")
-        logger.error(f"  Path: {args.data_path}")
-        logger.error(f"  Prefix: {args.name_prefix}")
-        logger.error(f"  Suffix: {args.name_suffix}")
-        logger.error(f"  Filter: {args.filename_filter}")
-        return None, None
+        logger.error("  Path: %s", args.data_path)
+        logger.error("  Prefix: %s", args.name_prefix)
+        logger.error("  Suffix: %s", args.name_suffix)
+        logger.error("  Filter: %s", args.filename_filter)
+        return None
 
-    logger.info(f"Found {len(file_list)} files to process")
+    logger.info("Found %s files to process", len(file_list))
     if logger.isEnabledFor(logging.DEBUG):
         for f in file_list:
-            logger.debug(f"  {f}")
+            logger.debug("  %s", f)
+
+    if args.cache_dir:
+        try:
+            Path(args.cache_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error("Cannot create cache directory %s: %s", args.cache_dir, e)
+            return None
+        logger.info("Caching per-file counts in: %s", args.cache_dir)
 
     # Process each file
     logger.info("Processing files and counting HED tags...")
-    all_tag_counts = []
+    # Reduce each result as it arrives so per-file counts can be freed right away
+    merged_counts = HedTagCounts("Combined Dataset")
     successful_files = 0
     failed_files = 0
 
-    for tsv_path in file_list:
-        try:
-            logger.debug(f"Processing: {tsv_path}")
-
-            # Find sidecar
-            sidecar_path = find_sidecar(Path(tsv_path), args.sidecar_pattern)
-            if sidecar_path:
-                logger.debug(f"  Found sidecar: {sidecar_path}")
-                # Pass the path, not the loaded dictionary
-                sidecar = str(sidecar_path)
-            else:
-                logger.debug("  No sidecar found")
-                sidecar = None
-
-            # Create TabularInput
-            tabular = TabularInput(tsv_path, sidecar=sidecar, name=str(tsv_path))
-
-            # Compute tag counts
-            tag_counts = HedTagCounts(str(tsv_path), total_events=len(tabular.dataframe))
-            tag_man = HedTagManager(EventManager(tabular, schema), remove_types=args.remove_types or [])
-            hed_objs = tag_man.get_hed_objs(include_context=args.include_context, replace_defs=args.replace_defs)
-            for hed in hed_objs:
-                tag_counts.update_tag_counts(hed, str(tsv_path))
-
-            all_tag_counts.append(tag_counts)
-            successful_files += 1
-            logger.debug(
-                f"  Successfully processed: {len(tabular.dataframe)} events, {len(tag_counts.tag_dict)} unique tags"
-            )
+    process_one = partial(
+        _process_one_file,
+        schema_version=schema_version,
+        sidecar_pattern=args.sidecar_pattern,
+        remove_types=args.remove_types or [],
+        include_context=args.include_context,
+        replace_defs=args.replace_defs,
+        cache_dir=args.cache_dir,
+    )
+    jobs = min(args.jobs if args.jobs > 0 else os.cpu_count() or 1, len(file_list))
+    if jobs > 1:
+        logger.info("Using %s worker processes", jobs)
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema_version,))
+        size = max(1, len(file_list) // (4 * jobs))
+        chunks = [file_list[i : i + size] for i in range(0, len(file_list), size)]
+        results = executor.map(partial(_process_chunk, process_one=process_one), chunks)
+    else:
+        executor = None
+        results = (_process_chunk((tsv_path,), process_one) for tsv_path in file_list)
 
-        except Exception as e:
-            logger.error(f"Failed to process {tsv_path}: {e}")
-            failed_files += 1
-            continue
+    try:
+        for chunk_counts, chunk_successes, chunk_errors in results:
+            for tsv_path, error in chunk_errors:
+                logger.error("Failed to process %s: %s", tsv_path, error)
+            failed_files += len(chunk_errors)
+            successful_files += chunk_successes
+            if chunk_counts is not None:
+                _merge_into(merged_counts, chunk_counts)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # Log final statistics
     logger.info("Processing complete:")
-    logger.info(f"  Successfully processed: {successful_files} files")
+    logger.info("  Successfully processed: %s files", successful_files)
     if failed_files > 0:
-        logger.warning(f"  Failed to process: {failed_files} files")
+        logger.warning("  Failed to process: %s files", failed_files)
 
     if successful_files == 0:
         logger.error("No files were successfully processed.")
-        return None, None
+        return None
+
+    logger.info("Merged tag counts from all files:")
+    logger.info("  Total events: %s", merged_counts.total_events)
+    logger.info("  Unique tags: %s", len(merged_counts.tag_dict))
+    logger.info("  Files processed: %s", len(merged_counts.files))
+
+    return merged_counts
 
-    # Merge all tag counts
-    logger.info("Merging tag counts from all files...")
-    merged_counts = merge_tag_counts(all_tag_counts)
-    logger.info(f"  Total events: {merged_counts.total_events}")
-    logger.info(f"  Unique tags: {len(merged_counts.tag_dict)}")
-    logger.info(f"  Files processed: {len(merged_counts.files)}")
 
-    # Generate visualizations
+def generate_visualizations(merged_counts: HedTagCounts, args, logger) -> Optional[dict]:
+    """Generate the word cloud for merged tag counts.
+
+    Parameters:
+        merged_counts (HedTagCounts): Merged tag counts. They are only read.
+        args (argparse.Namespace): Parsed command line arguments.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        dict or None: Visualization results, or None if disabled or generation failed.
+    """
     visualization_results = None
     if not args.no_word_cloud:
+        from hedvis.core.tag_visualizer import HedTagVisualizer
+        from hedvis.core.visualization_config import VisualizationConfig, WordCloudConfig
+
         logger.info("Generating visualizations...")
 
         # Load tag template if specified
         tag_template = None
         if args.tag_template:
-            logger.info(f"Loading tag template from: {args.tag_template}")
+            logger.info("Loading tag template from: %s", args.tag_template)
             tag_template = load_tag_template(args.tag_template)
             if tag_template:
-                logger.info(f"  Template has {len(tag_template)} categories")
+                logger.info("  Template has %s categories", len(tag_template))
 
         # Configure word cloud
         wc_config = WordCloudConfig(
@@ -525,6 +1092,7 @@ def process_files(args, logger):
             mask_path=args.mask_path,
             contour_width=args.contour_width,
             contour_color=args.contour_color,
+            svg_optimize=args.svg_optimize,
         )
 
         # Configure visualization
@@ -544,13 +1112,33 @@ def process_files(args, logger):
                 wc_results = visualization_results["word_cloud"]
                 for key, value in wc_results.items():
                     if key.endswith("_path"):
-                        logger.info(f"  Saved {key.replace('_path', '')}: {value}")
+                        logger.info("  Saved %s: %s", key.replace("_path", ""), value)
 
         except Exception as e:
-            logger.error(f"Failed to generate visualizations: {e}")
+            logger.error("Failed to generate visualizations: %s", e)
             visualization_results = None
 
-    return merged_counts, visualization_results
+    return visualization_results
+
+
+def _write_tag_counts_json(output_path, header, tag_items):
+    """Stream the tag counts JSON one tag per line without building the full output dictionary.
+
+    Parameters:
+        output_path (Path): Path of the JSON file to write.
+        header (dict): Top-level keys written before the tags.
+        tag_items (iterable): (tag, entry) pairs written under the "tags" key.
+    """
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+        f.write('  "tags": {')
+        separator = "\n"
+        for tag, entry in tag_items:
+            f.write(f"{separator}    {json.dumps(tag)}: {json.dumps(entry)}")
+            separator = ",\n"
+        f.write("\n  }\n}\n")
 
 
 def save_tag_counts(tag_counts: HedTagCounts, output_file: str, logger):
@@ -565,27 +1153,29 @@ def save_tag_counts(tag_counts: HedTagCounts, output_file: str, logger):
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create output dictionary
-        output_dict = {
+        header = {
             "name": tag_counts.name,
             "total_events": tag_counts.total_events,
             "total_files": len(tag_counts.files),
-            "files": list(tag_counts.files.keys()),
-            "tags": {},
+            "files": list(tag_counts.files),
         }
+        # Values of tag_dict are HedTagCount objects
+        tag_items = (
+            (tag_count.tag, {"events": tag_count.events, "files": list(tag_count.files)})
+            for tag_count in tag_counts.tag_dict.values()
+        )
 
-        # Convert tag_dict to serializable format - values are HedTagCount objects
-        for _tag_key, tag_count in tag_counts.tag_dict.items():
-            output_dict["tags"][tag_count.tag] = {"events": tag_count.events, "files": list(tag_count.files.keys())}
-
-        # Write to file
-        with open(output_path, "w") as f:
-            json.dump(output_dict, f, indent=2)
+        if orjson is not None:
+            header["tags"] = dict(tag_items)
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2))
+        else:
+            _write_tag_counts_json(output_path, header, tag_items)
 
-        logger.info(f"Saved tag counts to: {output_file}")
+        logger.info("Saved tag counts to: %s", output_file)
 
     except Exception as e:
-        logger.error(f"Failed to save tag counts: {e}")
+        logger.error("Failed to save tag counts: %s", e)
 
 
 def main(arg_list=None):
@@ -607,24 +1197,30 @@ def main(arg_list=None):
 
     try:
         # Process files
-        merged_counts, visualization_results = process_files(args, logger)
+        merged_counts = count_tags(args, logger)
 
         if merged_counts is None:
             logger.error("Processing failed.")
             return 1
 
-        # Save tag counts if requested
+        # Save tag counts if requested, overlapping the write with word cloud rendering.
+        # Both only read merged_counts.
         if args.save_counts:
             output_file = args.output_file or "hed_tag_counts.json"
             if args.output_dir:
                 output_file = str(Path(args.output_dir) / output_file)
-            save_tag_counts(merged_counts, output_file, logger)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                saving = executor.submit(save_tag_counts, merged_counts, output_file, logger)
+                generate_visualizations(merged_counts, args, logger)
+                saving.result()
+        else:
+            generate_visualizations(merged_counts, args, logger)
 
         logger.info("All operations completed successfully.")
         return 0
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return 1
 
 
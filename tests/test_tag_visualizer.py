@@ -1,14 +1,71 @@
 """Tests for HedTagVisualizer."""
 
+import functools
+import io
 import unittest
+from unittest import mock
 import tempfile
 import shutil
 import os
+import re
 from pathlib import Path
+from PIL import Image
 from hedvis import HedTagVisualizer, VisualizationConfig, WordCloudConfig
-from hed.tools.analysis.hed_tag_counts import HedTagCounts
-from hed.models import HedString, TabularInput, Sidecar
-from hed.schema import load_schema_version
+from hedvis.core.tag_visualizer import _load_schema_cached, _top_frequencies
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture():
+    """Load the schema, sidecar and tabular input shared by the tests once per session.
+
+    Returns:
+        tuple: (HedSchema, Sidecar, TabularInput) for the FacePerception test data.
+    """
+    # hed is imported lazily so that tests which do not need the fixture start quickly
+    from hed.models import TabularInput, Sidecar
+    from hed.schema import load_schema_version
+
+    data_path = os.path.join(os.path.dirname(__file__), "data", "sub-002_task-FacePerception_run-1_events.tsv")
+    json_path = os.path.join(os.path.dirname(__file__), "data", "task-FacePerception_events.json")
+
+    schema = load_schema_version("8.1.0")
+    sidecar = Sidecar(json_path)
+    input_data = TabularInput(data_path, sidecar=sidecar)
+    return schema, sidecar, input_data
+
+
+@functools.lru_cache(maxsize=None)
+def _first_hed_strings(count=20):
+    """Return the non-empty HED strings of the first events of the shared fixture.
+
+    Parameters:
+        count (int): Number of events to take (fewer are used for speed).
+
+    Returns:
+        tuple: The assembled HED strings, computed once since series_a reassembles the whole file.
+    """
+    _schema, _sidecar, input_data = _load_fixture()
+    return tuple(hed_string for hed_string in input_data.series_a.iloc[:count] if hed_string)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_tag_counts():
+    """Count the tags of the first 20 events of the shared fixture once per session.
+
+    Returns:
+        HedTagCounts: Populated counts. Tests only read them, so they are shared.
+    """
+    from hed.models import HedString
+    from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
+    schema, _sidecar, input_data = _load_fixture()
+    tag_counts = HedTagCounts(input_data.name, len(input_data.dataframe))
+
+    # Process some events to populate tag_counts. Each string is parsed once per session, and
+    # these strings are all distinct, so a HedString parse cache would never hit.
+    for hed_string in _first_hed_strings():
+        tag_counts.update_tag_counts(HedString(hed_string, schema), input_data.name)
+    return tag_counts
 
 
 class TestHedTagVisualizerInit(unittest.TestCase):
@@ -18,13 +75,20 @@ class TestHedTagVisualizerInit(unittest.TestCase):
         """Test initialization with default config."""
         visualizer = HedTagVisualizer()
         self.assertIsInstance(visualizer.config, VisualizationConfig)
-        self.assertEqual(visualizer.config.output_formats, ["svg"])
+        self.assertIs(visualizer.config, VisualizationConfig.default())
+        self.assertEqual(visualizer.config.output_formats, ("svg",))
+
+    def test_init_default_not_shared_mutably(self):
+        """Test that the shared default configuration cannot be changed through one visualizer."""
+        with self.assertRaises(AttributeError):
+            HedTagVisualizer().config.output_formats.append("png")
+        self.assertEqual(HedTagVisualizer().config.output_formats, ("svg",))
 
     def test_init_with_config_object(self):
         """Test initialization with VisualizationConfig object."""
         config = VisualizationConfig(output_formats=["png"], save_directory="/tmp")
         visualizer = HedTagVisualizer(config)
-        self.assertEqual(visualizer.config.output_formats, ["png"])
+        self.assertEqual(visualizer.config.output_formats, ("png",))
         self.assertEqual(visualizer.config.save_directory, "/tmp")
 
     def test_init_with_dict(self):
@@ -35,7 +99,7 @@ class TestHedTagVisualizerInit(unittest.TestCase):
             "word_cloud": {"width": 1200, "height": 800},
         }
         visualizer = HedTagVisualizer(config_dict)
-        self.assertEqual(visualizer.config.output_formats, ["svg", "png"])
+        self.assertEqual(visualizer.config.output_formats, ("svg", "png"))
         self.assertEqual(visualizer.config.save_directory, "./output")
         self.assertEqual(visualizer.config.word_cloud.width, 1200)
 
@@ -43,22 +107,10 @@ class TestHedTagVisualizerInit(unittest.TestCase):
 class TestHedTagVisualizerWordFrequencies(unittest.TestCase):
     """Tests for word frequency extraction."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create real HedTagCounts with actual data
-        data_path = os.path.join(os.path.dirname(__file__), "data", "sub-002_task-FacePerception_run-1_events.tsv")
-        json_path = os.path.join(os.path.dirname(__file__), "data", "task-FacePerception_events.json")
-
-        schema = load_schema_version("8.1.0")
-        sidecar = Sidecar(json_path)
-        input_data = TabularInput(data_path, sidecar=sidecar)
-
-        self.tag_counts = HedTagCounts(input_data.name, len(input_data.dataframe))
-
-        # Process some events to populate tag_counts
-        for hed_string in input_data.series_a[:20]:  # Use first 20 events for speed
-            if hed_string:
-                self.tag_counts.update_tag_counts(HedString(hed_string, schema), input_data.name)
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared, read-only tag counts."""
+        cls.tag_counts = _load_tag_counts()
 
     def test_extract_word_frequencies_no_template(self):
         """Test extracting word frequencies without template."""
@@ -101,20 +153,50 @@ class TestHedTagVisualizerWordFrequencies(unittest.TestCase):
             self.assertIsInstance(count, int)
             self.assertGreater(count, 0)
 
+    def test_extract_word_frequencies_match_counts(self):
+        """Test that frequencies are the aggregated event counts whether or not a template is used."""
+        visualizer = HedTagVisualizer()
+        expected = {count.tag: count.events for count in self.tag_counts.tag_dict.values()}
+        template = {"Sensory": ["Visual-presentation", "Sensory-event"], "Task": ["Experimental-trial"]}
+
+        self.assertEqual(visualizer._extract_word_frequencies(self.tag_counts), expected)
+        self.assertEqual(visualizer._extract_word_frequencies(self.tag_counts, template), expected)
+
+
+class TestTopFrequencies(unittest.TestCase):
+    """Tests for selecting the most frequent words."""
+
+    def test_top_frequencies_matches_sorted(self):
+        """Test that ordering (including ties) matches a stable descending sort."""
+        word_freq = {"a": 2, "b": 5, "c": 2, "d": 7, "e": 5, "f": 1}
+        expected = dict(sorted(word_freq.items(), key=lambda item: item[1], reverse=True))
+        self.assertEqual(list(_top_frequencies(word_freq, 10).items()), list(expected.items()))
+        self.assertEqual(list(_top_frequencies(word_freq, 3)), ["d", "b", "e"])
+
+    def test_top_frequencies_empty(self):
+        """Test that an empty dictionary is returned unchanged."""
+        self.assertEqual(_top_frequencies({}, 5), {})
+
 
 class TestHedTagVisualizerGenerateWordCloud(unittest.TestCase):
     """Tests for word cloud generation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory for the class."""
+        cls._tmp = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class temporary directory."""
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        # Each test writes to its own (not yet created) subdirectory of the class directory
+        self.temp_dir = os.path.join(self._tmp, self._testMethodName)
         self.word_freq = {"Visual": 50, "Auditory": 30, "Action": 20}
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
     def test_generate_word_cloud_no_save(self):
         """Test generating word cloud without saving."""
         config = VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300))
@@ -128,6 +210,41 @@ class TestHedTagVisualizerGenerateWordCloud(unittest.TestCase):
         self.assertNotIn("svg_path", result)
         self.assertNotIn("png_path", result)
 
+    def test_generate_word_cloud_max_words(self):
+        """Test that only the most frequent words are passed to the word cloud."""
+        config = VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300, max_words=2))
+        visualizer = HedTagVisualizer(config)
+
+        result = visualizer._generate_word_cloud(self.word_freq, "test")
+
+        words = {word for (word, _freq), *_rest in result["wordcloud_object"].layout_}
+        self.assertEqual(words, {"Visual", "Auditory"})
+
+    def test_generate_word_cloud_color_func_per_render(self):
+        """Test that each render steps through the colormap with its own color function."""
+        config = VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300))
+        visualizer = HedTagVisualizer(config)
+
+        first = visualizer._generate_word_cloud(self.word_freq, "first")["wordcloud_object"].color_func
+        second = visualizer._generate_word_cloud(self.word_freq, "second")["wordcloud_object"].color_func
+
+        self.assertIsNot(first.__self__, second.__self__)
+        # The colormap lookup is still shared
+        self.assertIs(first.__self__.colormap, second.__self__.colormap)
+
+    def test_generate_word_cloud_no_formats(self):
+        """Test that no directory is created when there are no output formats."""
+        save_dir = Path(self.temp_dir) / "unused"
+        config = VisualizationConfig(
+            output_formats=[], save_directory=str(save_dir), word_cloud=WordCloudConfig(width=400, height=300)
+        )
+        visualizer = HedTagVisualizer(config)
+
+        result = visualizer._generate_word_cloud(self.word_freq, "test")
+
+        self.assertEqual(list(result), ["wordcloud_object"])
+        self.assertFalse(save_dir.exists())
+
     def test_generate_word_cloud_save_svg(self):
         """Test generating and saving word cloud as SVG."""
         config = VisualizationConfig(
@@ -145,9 +262,10 @@ class TestHedTagVisualizerGenerateWordCloud(unittest.TestCase):
         self.assertTrue(svg_path.exists())
         self.assertEqual(svg_path.name, "test_output.svg")
 
-        # Check that it contains SVG content
-        content = svg_path.read_text()
-        self.assertIn("<svg", content)
+        # Check that it contains SVG content (the root element is at the start of the file)
+        with open(svg_path, "rb") as svg_file:
+            head = svg_file.read(4096)
+        self.assertIn(b"<svg", head)
 
     def test_generate_word_cloud_save_png(self):
         """Test generating and saving word cloud as PNG."""
@@ -186,6 +304,145 @@ class TestHedTagVisualizerGenerateWordCloud(unittest.TestCase):
         self.assertTrue(Path(result["png_path"]).exists())
         self.assertTrue(Path(result["jpg_path"]).exists())
 
+    def test_generate_word_cloud_svg_optimize(self):
+        """Test that optimized SVG output is smaller and keeps every word."""
+        wc = HedTagVisualizer(
+            VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300))
+        )._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+        sizes, words = {}, {}
+        for optimize in (False, True):
+            config = VisualizationConfig(
+                output_formats=["svg"],
+                save_directory=os.path.join(self.temp_dir, str(optimize)),
+                word_cloud=WordCloudConfig(width=400, height=300, svg_optimize=optimize),
+            )
+            # Save the same layout both ways, since each generated layout is random
+            paths = HedTagVisualizer(config)._save_word_cloud(wc, "test_output")
+            svg = Path(paths["svg_path"]).read_text(encoding="utf-8")
+            sizes[optimize] = len(svg)
+            words[optimize] = re.findall(r">([^<>]+)</text>", svg)
+
+        self.assertLess(sizes[True], sizes[False])
+        self.assertEqual(words[True], words[False])
+
+    def test_generate_word_cloud_renders_raster_once(self):
+        """Test that one raster image is rendered for all raster outputs."""
+        config = VisualizationConfig(
+            output_formats=["svg", "png", "jpg", "jpeg"],
+            save_directory=self.temp_dir,
+            word_cloud=WordCloudConfig(width=400, height=300),
+        )
+        visualizer = HedTagVisualizer(config)
+        wc = visualizer._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+
+        with mock.patch.object(wc, "to_image", wraps=wc.to_image) as to_image:
+            paths = visualizer._save_word_cloud(wc, "test_output")
+
+        self.assertEqual(to_image.call_count, 1)
+        self.assertEqual(len(paths), 4)
+
+    def test_generate_word_cloud_save_jpg_and_jpeg(self):
+        """Test that several JPEG outputs are written from one rendered image."""
+        config = VisualizationConfig(
+            output_formats=["jpg", "jpeg"],
+            save_directory=self.temp_dir,
+            word_cloud=WordCloudConfig(width=400, height=300),
+        )
+        visualizer = HedTagVisualizer(config)
+
+        result = visualizer._generate_word_cloud(self.word_freq, "test_output")
+
+        self.assertTrue(Path(result["jpg_path"]).exists())
+        self.assertTrue(Path(result["jpeg_path"]).exists())
+        self.assertEqual(Path(result["jpg_path"]).read_bytes(), Path(result["jpeg_path"]).read_bytes())
+
+    def test_generate_word_cloud_save_jpg_opaque_background(self):
+        """Test saving JPEG output when the background is opaque."""
+        config = VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300, background_color="white"))
+        visualizer = HedTagVisualizer(config)
+        wc = visualizer._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+
+        buffer = io.BytesIO()
+        visualizer.write_word_cloud(wc, {"jpg": buffer})
+
+        with Image.open(io.BytesIO(buffer.getvalue())) as img:
+            self.assertEqual(img.mode, "RGB")
+            self.assertEqual(img.size, (400, 300))
+            self.assertTrue(all(channel > 245 for channel in img.getpixel((0, 0))))
+
+        # The word cloud's own background decides, even when the writing config differs
+        transparent = HedTagVisualizer(
+            VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300))
+        )._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+        black = HedTagVisualizer(
+            VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300, background_color="black"))
+        )._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+        for wc, writer_config, expected_white in (
+            (transparent, config, True),
+            (black, VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300)), False),
+        ):
+            buffer = io.BytesIO()
+            HedTagVisualizer(writer_config).write_word_cloud(wc, {"jpg": buffer})
+            with Image.open(io.BytesIO(buffer.getvalue())) as img:
+                corner = img.getpixel((0, 0))
+            if expected_white:
+                self.assertTrue(all(channel > 245 for channel in corner), corner)
+            else:
+                self.assertTrue(all(channel < 10 for channel in corner), corner)
+
+    def test_write_word_cloud_to_buffers(self):
+        """Test writing a word cloud to in-memory file objects."""
+        visualizer = HedTagVisualizer(VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300)))
+        wc = visualizer._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+
+        buffers = {"svg": io.BytesIO(), "png": io.BytesIO(), "gif": io.BytesIO()}
+        visualizer.write_word_cloud(wc, buffers)
+
+        self.assertTrue(buffers["svg"].getvalue().startswith(b"<svg"))
+        with Image.open(io.BytesIO(buffers["png"].getvalue())) as img:
+            self.assertEqual(img.format, "PNG")
+            self.assertEqual(img.size, (400, 300))
+        self.assertEqual(buffers["gif"].getvalue(), b"")
+        self.assertFalse(Path(self.temp_dir).exists())
+
+    def test_generate_word_cloud_directory_removed_between_saves(self):
+        """Test that the save directory is recreated if it is removed between saves."""
+        config = VisualizationConfig(
+            output_formats=["svg"], save_directory=self.temp_dir, word_cloud=WordCloudConfig(width=400, height=300)
+        )
+        visualizer = HedTagVisualizer(config)
+
+        visualizer._generate_word_cloud(self.word_freq, "first")
+        shutil.rmtree(self.temp_dir)
+        result = visualizer._generate_word_cloud(self.word_freq, "second")
+
+        self.assertTrue(Path(result["svg_path"]).exists())
+
+    def test_write_word_cloud_default_config(self):
+        """Test writing a word cloud with a configuration that has no word cloud settings."""
+        wc = HedTagVisualizer(
+            VisualizationConfig(word_cloud=WordCloudConfig(width=400, height=300))
+        )._generate_word_cloud(self.word_freq, "test")["wordcloud_object"]
+
+        buffers = {"svg": io.BytesIO(), "jpg": io.BytesIO()}
+        HedTagVisualizer().write_word_cloud(wc, buffers)
+
+        self.assertTrue(buffers["svg"].getvalue().startswith(b"<svg"))
+        with Image.open(io.BytesIO(buffers["jpg"].getvalue())) as img:
+            self.assertEqual(img.format, "JPEG")
+
+    def test_generate_word_cloud_unsupported_format(self):
+        """Test that unsupported output formats are skipped."""
+        config = VisualizationConfig(
+            output_formats=["gif"], save_directory=self.temp_dir, word_cloud=WordCloudConfig(width=400, height=300)
+        )
+        visualizer = HedTagVisualizer(config)
+
+        result = visualizer._generate_word_cloud(self.word_freq, "test_output")
+
+        self.assertEqual(list(result), ["wordcloud_object"])
+        self.assertEqual(list(Path(self.temp_dir).glob("*")), [])
+
     def test_generate_word_cloud_creates_directory(self):
         """Test that save directory is created if it doesn't exist."""
         save_dir = Path(self.temp_dir) / "subdir" / "output"
@@ -204,24 +461,20 @@ class TestHedTagVisualizerGenerateWordCloud(unittest.TestCase):
 class TestHedTagVisualizerVisualizeFromCounts(unittest.TestCase):
     """Tests for visualize_from_counts method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-        # Create real HedTagCounts with actual data
-        data_path = os.path.join(os.path.dirname(__file__), "data", "sub-002_task-FacePerception_run-1_events.tsv")
-        json_path = os.path.join(os.path.dirname(__file__), "data", "task-FacePerception_events.json")
-
-        schema = load_schema_version("8.1.0")
-        sidecar = Sidecar(json_path)
-        input_data = TabularInput(data_path, sidecar=sidecar)
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared, read-only tag counts and one temporary directory for the class."""
+        cls.tag_counts = _load_tag_counts()
+        cls._tmp = tempfile.mkdtemp()
 
-        self.tag_counts = HedTagCounts(input_data.name, len(input_data.dataframe))
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class temporary directory."""
+        shutil.rmtree(cls._tmp, ignore_errors=True)
 
-        # Process some events to populate tag_counts
-        for hed_string in input_data.series_a[:20]:  # Use first 20 events for speed
-            if hed_string:
-                self.tag_counts.update_tag_counts(HedString(hed_string, schema), input_data.name)
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = os.path.join(self._tmp, self._testMethodName)
 
     def test_visualize_from_counts_no_word_cloud(self):
         """Test visualization with no word cloud config."""
@@ -261,13 +514,10 @@ class TestHedTagVisualizerComputeTagCounts(unittest.TestCase):
 
     def test_compute_tag_counts(self):
         """Test computing tag counts from tabular input."""
-        # Load real data
-        data_path = os.path.join(os.path.dirname(__file__), "data", "sub-002_task-FacePerception_run-1_events.tsv")
-        json_path = os.path.join(os.path.dirname(__file__), "data", "task-FacePerception_events.json")
+        from hed.tools.analysis.hed_tag_counts import HedTagCounts
 
-        schema = load_schema_version("8.1.0")
-        sidecar = Sidecar(json_path)
-        tabular_input = TabularInput(data_path, sidecar=sidecar)
+        # Load real data
+        schema, _sidecar, tabular_input = _load_fixture()
 
         # Create visualizer
         visualizer = HedTagVisualizer()
@@ -284,5 +534,30 @@ class TestHedTagVisualizerComputeTagCounts(unittest.TestCase):
         self.assertGreater(len(tag_counts.tag_dict), 0)  # Should have extracted some tags
 
 
+class TestHedTagVisualizerVisualizeFromDataframe(unittest.TestCase):
+    """Tests for visualize_from_dataframe."""
+
+    def setUp(self):
+        """Start each test with an empty schema cache."""
+        _load_schema_cached.cache_clear()
+        self.addCleanup(_load_schema_cached.cache_clear)
+
+    def test_schema_string_loaded_once(self):
+        """Test that a schema given as a string is loaded only once across calls."""
+        schema, _sidecar, tabular_input = _load_fixture()
+        visualizer = HedTagVisualizer()
+
+        with (
+            mock.patch("hed.load_schema", return_value=schema) as load_schema,
+            mock.patch.object(HedTagVisualizer, "visualize_from_tabular", return_value={}) as visualize,
+        ):
+            for _ in range(2):
+                visualizer.visualize_from_dataframe(tabular_input.dataframe, "schema.xml")
+
+        load_schema.assert_called_once_with("schema.xml")
+        self.assertEqual(visualize.call_count, 2)
+        self.assertTrue(all(call.args[1] is schema for call in visualize.call_args_list))
+
+
 if __name__ == "__main__":
     unittest.main()
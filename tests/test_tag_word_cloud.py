@@ -1,11 +1,13 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import wordcloud
 from hedvis.generators import word_cloud as tag_word_cloud
 from hedvis.generators.word_cloud import load_and_resize_mask
+from hedvis.generators.word_cloud_util import minify_svg
 import matplotlib.font_manager as fm
 
 import numpy as np
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
 import os
 
 
@@ -68,6 +70,29 @@ class TestWordCloudFunctions(unittest.TestCase):
         self.assertEqual(wc.width, 400)
         self.assertEqual(wc.height, 300)
 
+    def test_create_wordcloud_font_cache(self):
+        word_dict = {f"tag{i}": 5 for i in range(10)}
+        original_truetype = ImageFont.truetype
+        tag_word_cloud._cached_truetype.cache_clear()
+        tag_word_cloud.create_wordcloud(word_dict, width=400, height=200)
+
+        self.assertIs(ImageFont.truetype, original_truetype)
+        self.assertGreater(tag_word_cloud._cached_truetype.cache_info().hits, 0)
+
+    def test_create_wordcloud_font_cache_threads(self):
+        word_dict = {f"tag{i}": i + 1 for i in range(10)}
+        original_truetype = ImageFont.truetype
+
+        def build(_index):
+            wc = tag_word_cloud.create_wordcloud(word_dict, width=200, height=100)
+            return tag_word_cloud.word_cloud_to_svg(wc)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            svgs = list(executor.map(build, range(16)))
+
+        self.assertEqual(len(svgs), 16)
+        self.assertIs(ImageFont.truetype, original_truetype)
+
     def test_mask_scaling(self):
         word_dict = {"tag1": 5, "tag2": 3, "tag3": 7}
         wc = tag_word_cloud.create_wordcloud(word_dict, self.mask_path, width=300, height=300)
@@ -107,6 +132,25 @@ class TestWordCloudFunctions(unittest.TestCase):
         self.assertTrue(svg_output.endswith("</svg>"))
         self.assertIn("fill:rgb", svg_output)
 
+    def test_minify_svg(self):
+        word_dict = {"tag1": 5, "tag2": 3, "tag3": 7}
+        wc = tag_word_cloud.create_wordcloud(word_dict, mask_path=self.mask_path, width=400, height=None)
+        svg_output = tag_word_cloud.word_cloud_to_svg(wc)
+        minified = minify_svg(svg_output)
+        self.assertTrue(minified.startswith("<svg"))
+        self.assertTrue(minified.endswith("</svg>"))
+        self.assertLess(len(minified), len(svg_output))
+        self.assertNotIn("rgb(", minified)
+        self.assertEqual(minified.count("<circle"), svg_output.count("<circle"))
+        self.assertEqual(minified.count("</text>"), svg_output.count("</text>"))
+
+    def test_minify_svg_rounds_attribute_values_only(self):
+        svg_output = '<svg width="10.004">\n  <text x="-0.001" style="fill:rgb(255, 0, 16)">1.23456</text>\n</svg>'
+        self.assertEqual(
+            minify_svg(svg_output),
+            '<svg width="10"><text x="0" style="fill:#ff0010">1.23456</text></svg>',
+        )
+
 
 class TestLoadAndResizeMask(unittest.TestCase):
     @classmethod
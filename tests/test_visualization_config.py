@@ -1,6 +1,7 @@
 """Tests for visualization configuration classes."""
 
 import unittest
+from dataclasses import FrozenInstanceError
 from hedvis.core.visualization_config import WordCloudConfig, VisualizationConfig
 
 
@@ -16,6 +17,7 @@ class TestWordCloudConfig(unittest.TestCase):
         self.assertEqual(config.prefer_horizontal, 0.75)
         self.assertEqual(config.min_font_size, 8)
         self.assertIsNone(config.max_font_size)
+        self.assertEqual(config.max_words, 200)
         self.assertIsNone(config.font_path)
         self.assertEqual(config.colormap, "nipy_spectral")
         self.assertEqual(config.color_range, (0.0, 0.5))
@@ -26,6 +28,7 @@ class TestWordCloudConfig(unittest.TestCase):
         self.assertEqual(config.contour_color, "black")
         self.assertEqual(config.scale_adjustment, 0.0)
         self.assertEqual(config.relative_scaling, 1.0)
+        self.assertFalse(config.svg_optimize)
 
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -71,6 +74,27 @@ class TestWordCloudConfig(unittest.TestCase):
         # Extra field should not be in config
         self.assertFalse(hasattr(config, "extra_field"))
 
+    def test_from_dict_memoized(self):
+        """Test that equal dictionaries return the same cached instance."""
+        first = WordCloudConfig.from_dict({"width": 640, "colormap": "plasma"})
+        second = WordCloudConfig.from_dict({"colormap": "plasma", "width": 640})
+        self.assertIs(first, second)
+        self.assertIsNot(first, WordCloudConfig.from_dict({"width": 640.0, "colormap": "plasma"}))
+        self.assertIsNot(first, WordCloudConfig.from_dict({"width": 641, "colormap": "plasma"}))
+
+    def test_from_dict_unhashable_value(self):
+        """Test that unhashable values bypass the cache but still build a config."""
+        config = WordCloudConfig.from_dict({"width": 512, "extra_field": {1, 2}})
+        self.assertEqual(config.width, 512)
+
+    def test_immutable(self):
+        """Test that configuration objects are frozen and slotted."""
+        config = WordCloudConfig()
+        with self.assertRaises(FrozenInstanceError):
+            config.width = 1000
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertEqual(hash(config), hash(WordCloudConfig()))
+
     def test_to_dict(self):
         """Test converting config to dictionary."""
         config = WordCloudConfig(width=1200, height=800, colormap="viridis")
@@ -90,7 +114,7 @@ class TestVisualizationConfig(unittest.TestCase):
     def test_default_config(self):
         """Test default configuration values."""
         config = VisualizationConfig()
-        self.assertEqual(config.output_formats, ["svg"])
+        self.assertEqual(config.output_formats, ("svg",))
         self.assertIsNone(config.save_directory)
         self.assertIsNone(config.word_cloud)
 
@@ -98,16 +122,27 @@ class TestVisualizationConfig(unittest.TestCase):
         """Test custom configuration values."""
         wc_config = WordCloudConfig(width=1200, height=800)
         config = VisualizationConfig(output_formats=["svg", "png"], save_directory="./output", word_cloud=wc_config)
-        self.assertEqual(config.output_formats, ["svg", "png"])
+        self.assertEqual(config.output_formats, ("svg", "png"))
         self.assertEqual(config.save_directory, "./output")
         self.assertIsInstance(config.word_cloud, WordCloudConfig)
         self.assertEqual(config.word_cloud.width, 1200)
 
+    def test_default_shared(self):
+        """Test that the default configuration is one shared instance."""
+        config = VisualizationConfig.default()
+        self.assertIs(config, VisualizationConfig.default())
+        self.assertEqual(config, VisualizationConfig())
+
+        # Filling the from_dict cache does not evict the default
+        for width in range(300):
+            VisualizationConfig.from_dict({"word_cloud": {"width": width}})
+        self.assertIs(VisualizationConfig.default(), config)
+
     def test_from_dict_simple(self):
         """Test creating config from simple dictionary."""
         config_dict = {"output_formats": ["png", "jpg"], "save_directory": "/tmp/output"}
         config = VisualizationConfig.from_dict(config_dict)
-        self.assertEqual(config.output_formats, ["png", "jpg"])
+        self.assertEqual(config.output_formats, ("png", "jpg"))
         self.assertEqual(config.save_directory, "/tmp/output")
         self.assertIsNone(config.word_cloud)
 
@@ -119,7 +154,7 @@ class TestVisualizationConfig(unittest.TestCase):
             "word_cloud": {"width": 1024, "height": 768, "background_color": "white", "colormap": "viridis"},
         }
         config = VisualizationConfig.from_dict(config_dict)
-        self.assertEqual(config.output_formats, ["svg"])
+        self.assertEqual(config.output_formats, ("svg",))
         self.assertEqual(config.save_directory, "./viz")
         self.assertIsInstance(config.word_cloud, WordCloudConfig)
         self.assertEqual(config.word_cloud.width, 1024)
@@ -127,6 +162,39 @@ class TestVisualizationConfig(unittest.TestCase):
         self.assertEqual(config.word_cloud.background_color, "white")
         self.assertEqual(config.word_cloud.colormap, "viridis")
 
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test that unknown keys are dropped and the input dictionary is left unchanged."""
+        config_dict = {"save_directory": "./viz", "word_cloud": {"width": 640, "bogus": 1}, "bogus": True}
+        config = VisualizationConfig._build(config_dict)
+        self.assertEqual(config.save_directory, "./viz")
+        self.assertEqual(config.word_cloud.width, 640)
+        self.assertEqual(config_dict["word_cloud"], {"width": 640, "bogus": 1})
+        self.assertIn("bogus", config_dict)
+
+    def test_from_dict_nested_memoized(self):
+        """Test that nested dictionaries are memoized and keep their container types."""
+        config_dict = {"output_formats": ["svg", "png"], "word_cloud": {"color_range": (0.1, 0.9)}}
+        config = VisualizationConfig.from_dict(config_dict)
+        self.assertIs(config, VisualizationConfig.from_dict(config_dict))
+        self.assertEqual(config.output_formats, ("svg", "png"))
+        self.assertIsInstance(config.output_formats, tuple)
+        self.assertEqual(config.word_cloud.color_range, (0.1, 0.9))
+        self.assertIsInstance(config.word_cloud.color_range, tuple)
+
+    def test_sequences_stored_as_tuples(self):
+        """Test that list values are stored as tuples so configs are hashable and not shared mutably."""
+        config = VisualizationConfig.from_dict(
+            {
+                "output_formats": ["svg", "png"],
+                "word_cloud": {"color_range": [0.1, 0.9], "color_step_range": [0.1, 0.2]},
+            }
+        )
+        self.assertEqual(config.output_formats, ("svg", "png"))
+        self.assertEqual(config.word_cloud.color_range, (0.1, 0.9))
+        self.assertEqual(config.word_cloud.color_step_range, (0.1, 0.2))
+        self.assertEqual(hash(config), hash(VisualizationConfig.from_dict(config.to_dict())))
+        self.assertEqual(hash(VisualizationConfig()), hash(VisualizationConfig.default()))
+
     def test_from_dict_with_wordcloud_object(self):
         """Test creating config from dictionary with WordCloudConfig object."""
         wc_config = WordCloudConfig(width=800, height=600)
@@ -175,6 +243,8 @@ class TestVisualizationConfig(unittest.TestCase):
         self.assertEqual(restored.word_cloud.prefer_horizontal, original.word_cloud.prefer_horizontal)
         self.assertEqual(restored.word_cloud.use_mask, original.word_cloud.use_mask)
         self.assertEqual(restored.word_cloud.mask_path, original.word_cloud.mask_path)
+        self.assertEqual(restored, original)
+        self.assertFalse(hasattr(restored, "__dict__"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,333 @@
+"""Tests for the visualize_hed_tags.py script."""
+
+import itertools
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# The script is not part of the package; import it from the scripts directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+import visualize_hed_tags  # noqa: E402
+
+
+class TestMakePredicate(unittest.TestCase):
+    """Tests that the script's filename test matches hedtools' check_filename."""
+
+    NAMES = [
+        "sub-01_task-A_events.tsv",
+        "SUB-01_Task-A_Events.TSV",
+        "sub-01_task-A_events.tsv.gz",
+        "sub-01_task-A_events.json",
+        "task-A_events.tsv",
+        "sub-01_events",
+        "events.tsv",
+        ".tsv",
+        "sub-01_task-A_beh.tsv",
+        "sub-01.events.tsv",
+        "participants.tsv",
+        "",
+    ]
+    PREFIXES = [None, "", [], "sub-", "SUB-", ["task-", "sub-"], ["x", "participants"]]
+    SUFFIXES = [None, "", [], "events", "_EVENTS", ["beh", "events"], ["s", "events"], "events.tsv"]
+    EXTENSIONS = [None, "", [], ".tsv", ".TSV", [".json", ".tsv"], [".tsv", "_events.tsv"], [".gz", ".tsv.gz"]]
+
+    def test_matches_check_filename(self):
+        """Test every combination of names and prefix, suffix and extension options."""
+        from hed.tools.util.io_util import check_filename
+
+        mismatches = []
+        for prefix, suffix, extensions in itertools.product(self.PREFIXES, self.SUFFIXES, self.EXTENSIONS):
+            predicate = visualize_hed_tags._make_predicate(prefix, suffix, extensions)
+            for name in self.NAMES:
+                expected = check_filename(name, name_prefix=prefix, name_suffix=suffix, extensions=extensions)
+                if predicate(name) != expected:
+                    mismatches.append((name, prefix, suffix, extensions, expected))
+        self.assertEqual(mismatches, [])
+
+
+class TestFindSidecar(unittest.TestCase):
+    """Tests for sidecar lookup."""
+
+    def setUp(self):
+        """Create a small dataset with a root-level sidecar."""
+        self.root = Path(tempfile.mkdtemp())
+        self.data_dir = self.root / "sub-02" / "eeg"
+        self.data_dir.mkdir(parents=True)
+        self.tsv_path = self.data_dir / "sub-02_run-1_events.tsv"
+        self.tsv_path.touch()
+        (self.root / "dataset_events.json").touch()
+        (self.data_dir / "local_events.json").touch()
+        visualize_hed_tags._index_directory.cache_clear()
+        visualize_hed_tags._glob_sidecar.cache_clear()
+
+    def tearDown(self):
+        """Remove the dataset."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_pattern_in_same_directory(self):
+        """Test that a plain pattern matches files next to the TSV."""
+        self.assertEqual(
+            visualize_hed_tags.find_sidecar(self.tsv_path, "*_events.json"), self.data_dir / "local_events.json"
+        )
+
+    def test_pattern_with_path_parts(self):
+        """Test that a pattern with path parts is resolved relative to the TSV's directory."""
+        sidecar = visualize_hed_tags.find_sidecar(self.tsv_path, "../../*_events.json")
+        self.assertIsNotNone(sidecar)
+        self.assertEqual(sidecar.resolve(), (self.root / "dataset_events.json").resolve())
+
+    def test_pattern_without_match(self):
+        """Test that no sidecar is returned when nothing matches."""
+        self.assertIsNone(visualize_hed_tags.find_sidecar(self.tsv_path, "../../*_beh.json"))
+        self.assertIsNone(visualize_hed_tags.find_sidecar(self.tsv_path, "*_beh.json"))
+
+
+class TestCountHedObjs(unittest.TestCase):
+    """Tests that the script's tag counting matches HedTagCounts.update_tag_counts."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Assemble the HED objects of the FacePerception fixture once."""
+        from hed.models import Sidecar, TabularInput
+        from hed.schema import load_schema_version
+        from hed.tools.analysis.event_manager import EventManager
+        from hed.tools.analysis.hed_tag_manager import HedTagManager
+
+        data_dir = os.path.join(os.path.dirname(__file__), "data")
+        schema = load_schema_version("8.1.0")
+        tabular = TabularInput(
+            os.path.join(data_dir, "sub-002_task-FacePerception_run-1_events.tsv"),
+            sidecar=Sidecar(os.path.join(data_dir, "task-FacePerception_events.json")),
+        )
+        tag_man = HedTagManager(EventManager(tabular, schema), remove_types=["Condition-variable", "Task"])
+        cls.hed_objs = list(tag_man.get_hed_objs(include_context=True, replace_defs=True))
+
+    @staticmethod
+    def _summary(tag_counts):
+        """Return the events, files and values of every tag."""
+        return {
+            key: (count.tag, count.events, dict(count.files), dict(count.value_dict))
+            for key, count in tag_counts.tag_dict.items()
+        }
+
+    def test_matches_update_tag_counts(self):
+        """Test that counting in place gives the same tag_dict as hedtools, across two files."""
+        from hed.tools.analysis.hed_tag_counts import HedTagCounts
+
+        expected = HedTagCounts("expected")
+        actual = HedTagCounts("actual")
+        for file_name in ("first.tsv", "second.tsv"):
+            for hed in self.hed_objs:
+                expected.update_tag_counts(hed, file_name)
+            visualize_hed_tags._count_hed_objs(actual, self.hed_objs, file_name)
+
+        self.assertGreater(len(expected.tag_dict), 0)
+        self.assertEqual(self._summary(actual), self._summary(expected))
+        self.assertEqual(actual.files, expected.files)
+
+
+class TestCountsCache(unittest.TestCase):
+    """Tests for the per-file tag count cache used by --cache-dir."""
+
+    def setUp(self):
+        """Copy one events file and its task sidecar into a temporary dataset."""
+        self.root = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.root, "cache")
+        os.mkdir(self.cache_dir)
+        data_dir = os.path.join(os.path.dirname(__file__), "data")
+        for name in ("sub-002_task-FacePerception_run-1_events.tsv", "task-FacePerception_events.json"):
+            shutil.copy(os.path.join(data_dir, name), self.root)
+        self.tsv_path = os.path.join(self.root, "sub-002_task-FacePerception_run-1_events.tsv")
+        visualize_hed_tags._index_directory.cache_clear()
+
+    def tearDown(self):
+        """Remove the dataset and cache."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _process(self):
+        """Count the tags of the events file through the cache."""
+        counts, error = visualize_hed_tags._process_one_file(
+            self.tsv_path, "8.1.0", None, ["Condition-variable"], True, True, self.cache_dir
+        )
+        self.assertIsNone(error)
+        return counts
+
+    def _summary(self, counts):
+        """Return the events and files of every tag."""
+        return {key: (count.events, dict(count.files)) for key, count in counts.tag_dict.items()}
+
+    def test_hit_miss_and_invalidation(self):
+        """Test that unchanged files are read from the cache and modified files are recounted."""
+        first = self._process()
+        first_entries = os.listdir(self.cache_dir)
+        self.assertEqual(len(first_entries), 1)
+
+        # A hit does not count again
+        with mock.patch.object(visualize_hed_tags, "_count_hed_objs", side_effect=AssertionError("recounted")):
+            cached = self._process()
+        self.assertEqual(self._summary(cached), self._summary(first))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        # A new modification time is a miss
+        stat = os.stat(self.tsv_path)
+        os.utime(self.tsv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with mock.patch.object(
+            visualize_hed_tags, "_count_hed_objs", wraps=visualize_hed_tags._count_hed_objs
+        ) as count:
+            recounted = self._process()
+        count.assert_called_once()
+        self.assertEqual(self._summary(recounted), self._summary(first))
+        # The stale entry is replaced rather than kept
+        entries = os.listdir(self.cache_dir)
+        self.assertEqual(len(entries), 1)
+        self.assertNotEqual(entries, first_entries)
+
+    def test_key_includes_hed_version(self):
+        """Test that counts cached by another hedtools version are not reused."""
+        args = (self.cache_dir, self.tsv_path, None, "8.1.0", [], True, True)
+        current = visualize_hed_tags._counts_cache_file(*args)
+        with mock.patch.object(visualize_hed_tags, "_hed_version", return_value="0.0.0"):
+            self.assertNotEqual(visualize_hed_tags._counts_cache_file(*args), current)
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Tests for log handler setup across repeated calls."""
+
+    def setUp(self):
+        """Create a temporary log directory and save the root logger state."""
+        self.root = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.root, "run.log")
+        root_logger = logging.getLogger()
+        self.saved_handlers = root_logger.handlers[:]
+        self.saved_level = root_logger.level
+        patcher = mock.patch.object(visualize_hed_tags, "_LAST_LOG_CFG", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Close the handlers installed by the tests and restore the root logger."""
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        for handler in self.saved_handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(self.saved_level)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _setup(self, *extra_args):
+        """Configure logging to the log file and return the script's logger."""
+        args = visualize_hed_tags.get_parser().parse_args([self.root, "-lf", self.log_file, "-lq", *extra_args])
+        return visualize_hed_tags.setup_logging(args)
+
+    def _read_log(self):
+        """Flush the root handlers and return the log file contents."""
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        return Path(self.log_file).read_text(encoding="utf-8")
+
+    def test_same_config_keeps_file(self):
+        """Test that a repeated call with the same settings does not truncate the log file."""
+        self._setup().warning("first run")
+        handlers = logging.getLogger().handlers[:]
+        self._setup().warning("second run")
+
+        self.assertEqual(logging.getLogger().handlers, handlers)
+        log = self._read_log()
+        self.assertIn("first run", log)
+        self.assertIn("second run", log)
+
+    def test_log_append(self):
+        """Test that --log-append keeps earlier content and the default overwrites it."""
+        Path(self.log_file).write_text("earlier content\n", encoding="utf-8")
+        self._setup("--log-append").warning("appended")
+        log = self._read_log()
+        self.assertTrue(log.startswith("earlier content\n"))
+        self.assertIn("appended", log)
+
+        self._setup().warning("overwritten")
+        log = self._read_log()
+        self.assertNotIn("earlier content", log)
+        self.assertIn("overwritten", log)
+
+    def test_changed_config_replaces_handlers(self):
+        """Test that new settings close the previous handlers instead of adding to them."""
+        self._setup()
+        old_handlers = logging.getLogger().handlers[:]
+        self.assertEqual(len(old_handlers), 1)
+
+        self._setup("--log-level", "DEBUG")
+        new_handlers = logging.getLogger().handlers
+        self.assertEqual(len(new_handlers), 1)
+        self.assertNotIn(old_handlers[0], new_handlers)
+        self.assertIsNone(old_handlers[0].stream)
+        self.assertEqual(new_handlers[0].level, logging.DEBUG)
+
+
+class TestMain(unittest.TestCase):
+    """End-to-end tests of the script's main function."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.out_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(os.path.dirname(__file__), "data")
+
+    def tearDown(self):
+        """Remove the output directory."""
+        shutil.rmtree(self.out_dir, ignore_errors=True)
+
+    def _save_counts(self, *extra_args):
+        """Run main on the test data and return the saved counts as bytes."""
+        out_dir = os.path.join(self.out_dir, str(len(os.listdir(self.out_dir))))
+        args = [self.data_dir, "-p", "sub-", "-s", "events", "--no-word-cloud", "--save-counts", "-o", out_dir, "-lq"]
+        self.assertEqual(visualize_hed_tags.main(args + list(extra_args)), 0)
+        return Path(out_dir, "hed_tag_counts.json").read_bytes()
+
+    def test_save_counts_parallel_matches_serial(self):
+        """Test that counting in worker processes saves the same counts as counting serially."""
+        serial = self._save_counts("--jobs", "1")
+        parallel = self._save_counts("--jobs", "2")
+
+        self.assertEqual(parallel, serial)
+        summary = json.loads(serial)
+        self.assertEqual(summary["total_files"], 4)
+        self.assertGreater(len(summary["tags"]), 0)
+
+    def _save_counts_and_render(self):
+        """Run main with both --save-counts and a word cloud, returning the exit code."""
+        args = [self.data_dir, "-p", "sub-", "-s", "events", "--save-counts", "-o", self.out_dir, "-lq"]
+        return visualize_hed_tags.main(args + ["--output-formats", "png", "-w", "200", "--height", "150"])
+
+    def test_save_counts_while_rendering(self):
+        """Test that saving counts alongside the word cloud writes both outputs."""
+        self.assertEqual(self._save_counts_and_render(), 0)
+
+        self.assertEqual(json.loads(Path(self.out_dir, "hed_tag_counts.json").read_bytes())["total_files"], 4)
+        images = list(Path(self.out_dir).glob("*.png"))
+        self.assertEqual(len(images), 1)
+        self.assertGreater(images[0].stat().st_size, 0)
+
+    def test_save_counts_error_fails_run(self):
+        """Test that an exception while saving counts is raised from the save future and fails the run."""
+        with mock.patch.object(visualize_hed_tags, "save_tag_counts", side_effect=OSError("disk full")) as save:
+            self.assertEqual(self._save_counts_and_render(), 1)
+        save.assert_called_once()
+
+    @unittest.skipIf(visualize_hed_tags.orjson is None, "orjson is not installed")
+    def test_save_counts_without_orjson(self):
+        """Test that the streaming JSON writer used without orjson saves the same counts as orjson."""
+        with_orjson = self._save_counts()
+        with mock.patch.object(visualize_hed_tags, "orjson", None):
+            without_orjson = self._save_counts()
+
+        self.assertEqual(json.loads(without_orjson), json.loads(with_orjson))
+
+
+if __name__ == "__main__":
+    unittest.main()